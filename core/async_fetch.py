@@ -0,0 +1,183 @@
+"""Asynchronous HTTP fetching for the scraping workers."""
+
+import asyncio
+import threading
+import concurrent.futures
+from typing import Dict, Iterable, Optional
+
+import requests
+
+# Try to import aiohttp, but make it optional
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Total simultaneous connections per session; aiohttp's default of 100 is
+# kept explicit so it is not mistaken for an accidental bottleneck.
+CONNECTION_LIMIT = 100
+
+def create_session(headers: Optional[Dict[str, str]] = None):
+    """Create a pooled aiohttp session. Must be called inside a running event loop."""
+    connector = aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
+    return aiohttp.ClientSession(connector=connector, headers=headers)
+
+def is_small_html(headers, max_bytes: int) -> bool:
+    """Whether response headers allow an HTML body of at most max_bytes; absent headers pass."""
+    content_type = headers.get('Content-Type', '')
+    if content_type and 'html' not in content_type:
+        return False
+    try:
+        return int(headers.get('Content-Length') or 0) <= max_bytes
+    except ValueError:
+        return True
+
+async def read_capped(stream, max_bytes: int) -> bytes:
+    """Read a response body stream until EOF or max_bytes, whichever comes first.
+    
+    StreamReader.read(n) returns only what is already buffered, so a body
+    arriving in several chunks would be cut short by a single read.
+    """
+    chunks = []
+    size = 0
+    while size < max_bytes:
+        chunk = await stream.readany()
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b''.join(chunks)[:max_bytes]
+
+async def fetch_text(session, url: str, semaphore: asyncio.Semaphore, timeout: int = 15,
+                     max_bytes: Optional[int] = None) -> Optional[str]:
+    """Fetch URL content, returning None on any failure or non-200 response.
+    
+    With max_bytes, non-HTML or oversized responses are dropped from their
+    headers alone and at most max_bytes of the body is read.
+    """
+    async with semaphore:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status == 200:
+                    if max_bytes is not None:
+                        if not is_small_html(response.headers, max_bytes):
+                            return None
+                        body = await read_capped(response.content, max_bytes)
+                        return body.decode(response.charset or 'utf-8', errors='replace') or None
+                    text = await response.text(errors="replace")
+                    return text or None
+        except Exception:
+            pass
+    return None
+
+async def fetch_bytes(session, url: str, semaphore: asyncio.Semaphore, timeout: int = 15) -> Optional[bytes]:
+    """Fetch URL body as bytes, returning None on any failure or non-200 response."""
+    async with semaphore:
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status == 200:
+                    return await response.read() or None
+        except Exception:
+            pass
+    return None
+
+async def fetch_all(urls: Iterable[str], session, concurrency: int = 5, timeout: int = 15) -> Dict[str, Optional[str]]:
+    """Fetch all URLs concurrently over one session, bounded by a semaphore."""
+    urls = list(urls)
+    semaphore = asyncio.Semaphore(concurrency)
+    pages = await asyncio.gather(*(fetch_text(session, url, semaphore, timeout) for url in urls))
+    return dict(zip(urls, pages))
+
+class BackgroundFetcher:
+    """Runs fetches on a dedicated asyncio loop thread and hands back concurrent futures.
+    
+    Callers on ordinary threads can start several fetches and wait on them
+    together. Without aiohttp the same interface is served by a small thread
+    pool over a requests session.
+    """
+    
+    def __init__(self, headers: Optional[Dict[str, str]] = None, concurrency: int = 20,
+                 session: Optional[requests.Session] = None):
+        self._headers = headers
+        self._concurrency = concurrency
+        if AIOHTTP_AVAILABLE:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+            self._thread.start()
+            self._session, self._semaphore = asyncio.run_coroutine_threadsafe(self._open(), self._loop).result()
+            self._pending = set()  # Loop futures not yet done, cancelled on close
+            self._pending_lock = threading.Lock()
+        else:
+            self._requests_session = session or requests.Session()
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+    
+    async def _open(self):
+        # Sessions and semaphores must be created on the loop that uses them
+        connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300, keepalive_timeout=30)
+        session = aiohttp.ClientSession(connector=connector, headers=self._headers)
+        return session, asyncio.Semaphore(self._concurrency)
+    
+    def _submit(self, coro) -> concurrent.futures.Future:
+        """Schedule coro on the loop thread, tracking it until it completes."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        with self._pending_lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+    
+    def _discard(self, future):
+        with self._pending_lock:
+            self._pending.discard(future)
+    
+    def fetch_text(self, url: str, timeout: int = 15) -> concurrent.futures.Future:
+        """Start fetching url; the future resolves to its text or None."""
+        if AIOHTTP_AVAILABLE:
+            return self._submit(fetch_text(self._session, url, self._semaphore, timeout))
+        return self._executor.submit(self._get, url, timeout, False)
+    
+    def fetch_bytes(self, url: str, timeout: int = 15) -> concurrent.futures.Future:
+        """Start fetching url; the future resolves to its body bytes or None."""
+        if AIOHTTP_AVAILABLE:
+            return self._submit(fetch_bytes(self._session, url, self._semaphore, timeout))
+        return self._executor.submit(self._get, url, timeout, True)
+    
+    def fetch_all_text(self, urls: Iterable[str], timeout: int = 15) -> concurrent.futures.Future:
+        """Start fetching all urls together; the future resolves to {url: text or None}."""
+        urls = list(urls)
+        if AIOHTTP_AVAILABLE:
+            return self._submit(
+                fetch_all(urls, self._session, concurrency=max(len(urls), 1), timeout=timeout))
+        return self._executor.submit(self._get_all, urls, timeout)
+    
+    def _get_all(self, urls, timeout):
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(urls), 1)) as pool:
+            pages = pool.map(lambda url: self._get(url, timeout, False), urls)
+            return dict(zip(urls, pages))
+    
+    def _get(self, url, timeout, as_bytes):
+        try:
+            response = self._requests_session.get(url, headers=self._headers, timeout=timeout)
+            if response.status_code == 200:
+                return (response.content if as_bytes else response.text) or None
+        except Exception:
+            pass
+        return None
+    
+    def close(self):
+        """Cancel outstanding fetches, close the session and stop the loop thread.
+        
+        Cancelling first means no caller is left waiting on a future whose
+        loop has stopped, which would never complete.
+        """
+        if AIOHTTP_AVAILABLE:
+            with self._pending_lock:
+                pending, self._pending = self._pending, set()
+            for future in pending:
+                future.cancel()
+            asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+        else:
+            self._executor.shutdown(wait=False)
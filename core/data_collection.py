@@ -3,50 +3,178 @@
 import os
 import time
 import uuid
-import json
+import queue
 import random
-import requests
 import threading
 import re
+import concurrent.futures
 from typing import Dict, List, Optional, Tuple
-from PyQt5.QtCore import QThread, pyqtSignal, QObject, QThreadPool, QRunnable
+from PyQt5.QtCore import QThread, pyqtSignal
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from models import BusinessData
-from utils.browser import BrowserManager
-from utils.data_extraction import EmailExtractor
-from utils.network import ProxyManager
+from utils.browser import BrowserManager, USER_AGENTS, RESULT_SELECTORS
+from utils.data_extraction import EmailExtractor, first_link_or_text_match, INSTAGRAM_LINK_SELECTOR
+from utils.network import ProxyManager, TokenBucket, create_pooled_session
 from utils.file_ops import FileManager
+from utils import json_io
+from core import async_fetch
 
-class DataProcessorSignals(QObject):
-    """Signals for data processing."""
-    data_ready = pyqtSignal(dict)
-    skipped = pyqtSignal(str)  # Signal for skipped entries
-    error = pyqtSignal(str)
+_RE_STYLE_URL = re.compile(r'url\("([^"]+)"\)')
+_RE_INSTAGRAM_URL = re.compile(r'instagram\.com/([a-zA-Z0-9_.]+)')
+_RE_HANDLE = re.compile(r'@([a-zA-Z0-9_.]+)')
+_RE_DIGIT = re.compile(r'\d')
 
-class DataProcessor(QRunnable):
-    """Processes a single search result entry."""
+# Candidate selectors for a search result's name and address, in priority order
+RESULT_NAME_SELECTORS = (
+    "div.fontHeadlineSmall",
+    "div.fontBodyMedium",
+    "h3",
+    "a",
+    "div[role='article'] > div > div > div > div > div",
+    "div[jsaction*='mouseover'] > div > div > div"
+)
+RESULT_ADDRESS_SELECTORS = (
+    "div.fontBodyMedium:last-child",
+    "div[role='article'] > div > div > div > div > div:last-child",
+    "div[jsaction*='mouseover'] > div > div > div:last-child"
+)
+
+# In-page scripts: each replaces a cascade of WebDriver round-trips with one call
+_JS_READ_RESULT = """
+const el = arguments[0];
+const pick = (selectors) => selectors.map((selector) => {
+    const node = el.querySelector(selector);
+    return node ? node.innerText.trim() : '';
+});
+const link = el.matches('a[href]') ? el : el.querySelector("a[href*='/maps/place/']");
+const heading = document.querySelector('h1.fontHeadlineLarge') || document.querySelector('h1');
+return {
+    names: pick(arguments[1]),
+    addresses: pick(arguments[2]),
+    text: el.innerText,
+    href: link ? link.href : null,
+    heading: heading ? heading.innerText : null
+};
+"""
+
+_JS_READ_PLACE = """
+const first = (selector) => document.querySelector(selector);
+const nameEl = first('h1.fontHeadlineLarge') || first('h1');
+const phoneButton = first("button[data-tooltip='Copy phone number']");
+const telLink = first("a[href*='tel:']");
+const addressButton = first("button[data-tooltip='Copy address']");
+const site = first("a[data-tooltip='Open website']") || Array.from(document.querySelectorAll("a[href*='http']"))
+    .find((a) => !a.getAttribute('href').includes('google'));
+return {
+    name: nameEl ? nameEl.innerText : null,
+    has_phone_button: !!phoneButton,
+    phone_label: phoneButton ? phoneButton.getAttribute('aria-label') : null,
+    phone_href: telLink ? telLink.getAttribute('href') : null,
+    website: site ? site.href : null,
+    has_address_button: !!addressButton,
+    address_label: addressButton ? addressButton.getAttribute('aria-label') : null,
+    body_texts: Array.from(document.querySelectorAll('div.fontBodyMedium'), (e) => e.innerText)
+};
+"""
+
+_JS_HEADING_TEXT = """
+const heading = document.querySelector('h1.fontHeadlineLarge') || document.querySelector('h1');
+return heading ? heading.innerText : null;
+"""
+
+_JS_CLICK = """
+const el = document.querySelector(arguments[0]);
+if (el) { el.click(); }
+return !!el;
+"""
+
+_JS_READ_BODY_TEXTS = """
+return Array.from(document.querySelectorAll('div.fontBodyMedium'), (e) => e.innerText);
+"""
+
+_JS_READ_HOURS = """
+const cell = (row, selector) => { const td = row.querySelector(selector); return td ? td.innerText : null; };
+const rows = Array.from(document.querySelectorAll(arguments[0]))
+    .map((row) => [cell(row, 'td:first-child'), cell(row, 'td:last-child')])
+    .filter((pair) => pair[0] !== null && pair[1] !== null);
+return {rows: rows, body_texts: Array.from(document.querySelectorAll('div.fontBodyMedium'), (e) => e.innerText)};
+"""
+
+_JS_READ_MAIN_IMAGE = """
+const img = document.querySelector(arguments[0]);
+return img ? {style: img.getAttribute('style'), src: img.getAttribute('src')} : null;
+"""
+
+# CSS selectors for what each panel click reveals
+HOURS_ROW_SELECTOR = "table tbody tr"
+IMAGE_VIEWER_SELECTOR = "button.cX2WmGKJbX__image-viewer-image"
+
+# Seconds to wait for a clicked panel before reading whatever is there
+PANEL_WAIT_TIMEOUT = 3
+
+# Warm drivers kept per run so entries can be loaded in parallel
+DRIVER_POOL_SIZE = 4
+
+# Collected entries are sent to the UI in lists of at most this many, or sooner
+# once this many seconds have passed since the last list was sent
+DATA_BATCH_SIZE = 16
+DATA_FLUSH_INTERVAL = 0.25
+
+# Places API lookups run this many at a time, paced to stay under the Places QPS quota
+API_WORKERS = 8
+API_REQUESTS_PER_SECOND = 10
+
+# Longest an enrich stage waits on a background fetch. Each request carries its own
+# timeout but may first queue behind the fetcher's concurrency limit, so this is a
+# backstop, chiefly for a fetcher that has been closed under the stage
+FETCH_RESULT_TIMEOUT = 30
+
+# Longest the end of a run waits for pool workers still running
+WORKER_SHUTDOWN_TIMEOUT = 30
+
+# Result kinds produced by DataProcessor stages
+RESULT_DATA = 'data'
+RESULT_SKIPPED = 'skipped'
+RESULT_ERROR = 'error'
+
+def releases_gil(stage):
+    """Mark a pipeline stage as I/O-bound so the scheduler may run it on the worker pool."""
+    stage.releases_gil = True
+    return stage
+
+class DataProcessor:
+    """Processes a single search result entry.
     
-    def __init__(self, driver, result_element, index, temp_dir, email_extractor, skip_missing_social):
-        super().__init__()
+    Work is split into stages: scrape() drives the shared browser and must run
+    on the scheduling thread, while enrich() only does network and file I/O.
+    With a driver pool, process() loads the entry on its own driver instead
+    and can run on a worker alongside other entries.
+    """
+    
+    def __init__(self, driver, result_element, index, temp_dir, email_extractor, skip_missing_social, session, fetcher,
+                 driver_pool=None, collect_images=False):
         self.driver = driver
+        self.driver_pool = driver_pool  # Queue of warm drivers borrowed by process()
         self.result_element = result_element
         self.index = index
         self.temp_dir = temp_dir
         self.email_extractor = email_extractor
         self.skip_missing_social = skip_missing_social
-        self.signals = DataProcessorSignals()
+        self.collect_images = collect_images  # Opening the photo viewer is slow, so it is opt-in
+        self.session = session  # Shared keep-alive pool from DataCollectorThread
+        self.fetcher = fetcher  # Shared background fetch loop from DataCollectorThread
+        self.image_url = None  # Found by scrape(), downloaded by enrich()
     
-    def run(self):
-        """Process the search result entry."""
+    def scrape(self):
+        """Read the entry from the browser and return a (kind, payload) result."""
         try:
             # Extract name and address from result element before clicking
             entry_info = self.extract_info_from_result()
-            entry_name = entry_info.get('name', 'Unknown')
-            entry_address = entry_info.get('address', 'N/A')
+            previous_heading = entry_info.get('heading')
             
             # Improved element interaction with multiple attempts
             max_attempts = 3
@@ -69,8 +197,43 @@ class DataProcessor(QRunnable):
                             raise Exception(f"Failed to click element after {max_attempts} attempts: {str(click_error)}")
                         time.sleep(random.uniform(0.5, 1.0))  # Wait before retry
             
-            # Wait for details to load with increased delay
-            time.sleep(random.uniform(1.0, 1.5))
+            # Wait for the details panel to switch to this entry
+            self.wait_until(lambda driver: driver.execute_script(_JS_HEADING_TEXT) not in (None, previous_heading))
+            
+            return self.read_details(entry_info)
+        except Exception as e:
+            return RESULT_ERROR, f"Error processing entry {self.index + 1}: {str(e)}"
+    
+    @releases_gil
+    def process(self, entry_info):
+        """Load the entry on a pooled driver, read and enrich it, and return the final result."""
+        self.driver = self.driver_pool.get()
+        try:
+            self.driver.get(entry_info['href'])
+            self.wait_until(lambda driver: driver.execute_script(_JS_HEADING_TEXT) is not None)
+            kind, payload = self.read_details(entry_info)
+        except Exception as e:
+            kind, payload = RESULT_ERROR, f"Error processing entry {self.index + 1}: {str(e)}"
+        finally:
+            self.driver_pool.put(self.driver)
+        
+        if kind == RESULT_DATA:
+            return self.enrich(payload)
+        return kind, payload
+    
+    def wait_until(self, condition, timeout=PANEL_WAIT_TIMEOUT):
+        """Wait for condition on the driver; returns False on timeout instead of raising."""
+        try:
+            WebDriverWait(self.driver, timeout).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    def read_details(self, entry_info):
+        """Read the open details panel and return a (kind, payload) result."""
+        try:
+            entry_name = entry_info.get('name', 'Unknown')
+            entry_address = entry_info.get('address', 'N/A')
             
             # Extract data
             data = self.extract_data()
@@ -88,191 +251,119 @@ class DataProcessor(QRunnable):
                 if self.skip_missing_social and data.get('website') == "N/A" and data.get('instagram') == "N/A":
                     business_name = data.get('name', entry_name)
                     business_address = data.get('address', entry_address)
-                    self.signals.skipped.emit(f"Skipped entry {self.index + 1} ({business_name}) - Address: {business_address} - No website or Instagram")
-                else:
-                    self.signals.data_ready.emit(data)
-            else:
-                self.signals.error.emit(f"Failed to extract data from entry {self.index + 1}")
+                    return RESULT_SKIPPED, f"Skipped entry {self.index + 1} ({business_name}) - Address: {business_address} - No website or Instagram"
+                return RESULT_DATA, data
+            return RESULT_ERROR, f"Failed to extract data from entry {self.index + 1}"
         except Exception as e:
-            self.signals.error.emit(f"Error processing entry {self.index + 1}: {str(e)}")
+            return RESULT_ERROR, f"Error processing entry {self.index + 1}: {str(e)}"
+    
+    @staticmethod
+    def needs_website_page(data):
+        """Whether enrich() needs the website's HTML to look for Instagram."""
+        website = data.get('website')
+        return bool(website) and website != "N/A" and data.get('instagram') == "N/A"
+    
+    @releases_gil
+    def enrich(self, data, pages_future=None):
+        """Fill in the fields that need the business website or a download.
+        
+        pages_future, if given, is a batch fetch already covering this website.
+        """
+        try:
+            website = data.get('website')
+            has_website = website and website != "N/A"
+            
+            # Start the website and image fetches so they overlap with the email crawl
+            pages = None
+            if self.needs_website_page(data):
+                pages = pages_future or self.fetcher.fetch_all_text([website], timeout=5)
+            image_future = self.fetcher.fetch_bytes(self.image_url, timeout=5) if self.image_url else None
+            
+            if has_website:
+                # Extract email from website
+                emails = self.email_extractor.extract_emails(website)
+                data['email'] = emails[0] if emails else "N/A"
+            
+            if pages is not None:
+                data['instagram'] = self.instagram_from_html(pages.result(timeout=FETCH_RESULT_TIMEOUT).get(website))
+            
+            if image_future is not None:
+                data['image_path'] = self.save_image(image_future.result(timeout=FETCH_RESULT_TIMEOUT))
+            
+            return RESULT_DATA, data
+        except Exception as e:
+            return RESULT_ERROR, f"Error processing entry {self.index + 1}: {str(e)}"
     
     def extract_info_from_result(self):
         """Extract the business name and address from the result element before clicking."""
         try:
-            info = {'name': 'Unknown', 'address': 'N/A'}
-            
-            # Try multiple selectors to find the name
-            name_selectors = [
-                "div.fontHeadlineSmall",
-                "div.fontBodyMedium",
-                "h3",
-                "a",
-                "div[role='article'] > div > div > div > div > div",
-                "div[jsaction*='mouseover'] > div > div > div"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_element = self.result_element.find_element(By.CSS_SELECTOR, selector)
-                    name_text = name_element.text.strip()
-                    if name_text and name_text != "Results":
-                        info['name'] = name_text
-                        break
-                except:
-                    continue
+            info = {'name': 'Unknown', 'address': 'N/A', 'href': None}
             
-            # If no selector worked for name, try to get any text from the result element
-            if info['name'] == 'Unknown':
-                try:
-                    text = self.result_element.text.strip()
-                    if text and text != "Results":
-                        # Split by newlines and take the first non-empty line
-                        lines = [line.strip() for line in text.split('\n') if line.strip()]
-                        if lines:
-                            info['name'] = lines[0]
-                except:
-                    pass
+            # Read every candidate selector in one round-trip
+            raw = self.driver.execute_script(_JS_READ_RESULT, self.result_element,
+                                             RESULT_NAME_SELECTORS, RESULT_ADDRESS_SELECTORS)
+            info['href'] = raw.get('href')
+            info['heading'] = raw.get('heading')  # Details panel shown before this entry is opened
+            names = raw.get('names') or []
+            addresses = raw.get('addresses') or []
+            text = (raw.get('text') or '').strip()
+            # Non-empty lines of the card text, shared by both fallbacks below
+            lines = [line.strip() for line in text.split('\n') if line.strip()] if text != "Results" else []
             
-            # Try to extract address from the result element
-            address_selectors = [
-                "div.fontBodyMedium:last-child",
-                "div[role='article'] > div > div > div > div > div:last-child",
-                "div[jsaction*='mouseover'] > div > div > div:last-child"
-            ]
+            for name_text in names:
+                if name_text and name_text != "Results":
+                    info['name'] = name_text
+                    break
             
-            for selector in address_selectors:
-                try:
-                    address_element = self.result_element.find_element(By.CSS_SELECTOR, selector)
-                    address_text = address_element.text.strip()
-                    if address_text and address_text != info['name']:
-                        info['address'] = address_text
-                        break
-                except:
-                    continue
+            # If no selector worked for name, try to get any text from the result element
+            if info['name'] == 'Unknown' and lines:
+                info['name'] = lines[0]
+            
+            for address_text in addresses:
+                if address_text and address_text != info['name']:
+                    info['address'] = address_text
+                    break
             
             # If no selector worked for address, try to get any text from the result element
-            if info['address'] == 'N/A':
-                try:
-                    text = self.result_element.text.strip()
-                    if text and text != "Results" and text != info['name']:
-                        # Split by newlines and look for address-like text
-                        lines = [line.strip() for line in text.split('\n') if line.strip()]
-                        # Skip the first line (likely the name)
-                        if len(lines) > 1:
-                            # Look for lines that might contain address information
-                            for line in lines[1:]:
-                                if any(char.isdigit() for char in line) or len(line.split()) > 3:
-                                    info['address'] = line
-                                    break
-                except:
-                    pass
+            if info['address'] == 'N/A' and lines and text != info['name']:
+                # Skip the first line (likely the name)
+                for line in lines[1:]:
+                    if _RE_DIGIT.search(line) or len(line.split()) > 3:
+                        info['address'] = line
+                        break
             
             return info
         except Exception as e:
             print(f"Error extracting info from result: {str(e)}")
-            return {'name': 'Unknown', 'address': 'N/A'}
+            return {'name': 'Unknown', 'address': 'N/A', 'href': None}
     
     def extract_data(self):
         """Extract detailed data from the business page."""
         try:
-            data = {}
+            # Static fields come back from a single script call
+            raw = self.driver.execute_script(_JS_READ_PLACE)
+            data = self._postprocess(raw)
             
-            # Extract name
-            try:
-                name_element = self.driver.find_element(By.CSS_SELECTOR, "h1.fontHeadlineLarge")
-                data['name'] = name_element.text if name_element else "N/A"
-            except:
-                try:
-                    name_element = self.driver.find_element(By.CSS_SELECTOR, "h1")
-                    data['name'] = name_element.text if name_element else "N/A"
-                except:
-                    data['name'] = "N/A"
-            
-            # Extract phone number
-            try:
-                phone_element = self.driver.find_element(By.CSS_SELECTOR, "button[data-tooltip='Copy phone number']")
-                phone = phone_element.get_attribute('aria-label')
-                if phone and 'Copy phone number' in phone:
-                    data['phone'] = phone.replace('Copy phone number ', '')
-                else:
-                    data['phone'] = phone or "N/A"
-            except:
-                try:
-                    phone_element = self.driver.find_element(By.XPATH, "//a[contains(@href, 'tel:')]")
-                    data['phone'] = phone_element.get_attribute('href').replace('tel:', '')
-                except:
-                    data['phone'] = "N/A"
-            
-            # Extract website
-            try:
-                website_element = self.driver.find_element(By.CSS_SELECTOR, "a[data-tooltip='Open website']")
-                data['website'] = website_element.get_attribute('href')
-            except:
-                try:
-                    website_element = self.driver.find_element(By.XPATH, "//a[contains(@href, 'http') and not(contains(@href, 'google'))]")
-                    data['website'] = website_element.get_attribute('href')
-                except:
-                    data['website'] = "N/A"
-            
-            # Extract email from website
-            if data.get('website') and data['website'] != "N/A":
-                emails = self.email_extractor.extract_emails(data['website'])
-                data['email'] = emails[0] if emails else "N/A"
-            else:
-                data['email'] = "N/A"
-            
-            # Extract Instagram
-            try:
-                data['instagram'] = self.extract_instagram()
-            except:
-                data['instagram'] = "N/A"
-            
-            # Extract address
-            try:
-                address_element = self.driver.find_element(By.CSS_SELECTOR, "button[data-tooltip='Copy address']")
-                address = address_element.get_attribute('aria-label')
-                if address and 'Copy address' in address:
-                    data['address'] = address.replace('Copy address ', '')
-                else:
-                    data['address'] = address or "N/A"
-            except:
-                try:
-                    # Try alternative address selectors
-                    address_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.fontBodyMedium")
-                    for element in address_elements:
-                        text = element.text.strip()
-                        if text and any(char.isdigit() for char in text) and len(text.split()) > 3:
-                            data['address'] = text
-                            break
-                    else:
-                        data['address'] = "N/A"
-                except:
-                    data['address'] = "N/A"
+            # An entry that will be skipped needs none of the panel clicks below
+            if self.skip_missing_social and data['website'] == "N/A" and data['instagram'] == "N/A":
+                return data
             
             # Extract opening hours
             try:
-                hours_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='hours']")
-                hours_button.click()
-                time.sleep(random.uniform(0.3, 0.7))  # Reduced delay
+                if not self.driver.execute_script(_JS_CLICK, "button[aria-label*='hours']"):
+                    raise LookupError("No hours button")
+                self.wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, HOURS_ROW_SELECTOR)))
                 
-                hours_elements = self.driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-                hours_dict = {}
-                for row in hours_elements:
-                    try:
-                        day = row.find_element(By.CSS_SELECTOR, "td:first-child").text
-                        time = row.find_element(By.CSS_SELECTOR, "td:last-child").text
-                        hours_dict[day] = time
-                    except:
-                        continue
+                hours = self.driver.execute_script(_JS_READ_HOURS, HOURS_ROW_SELECTOR)
+                hours_dict = {day: hours_text for day, hours_text in hours['rows']}
                 
                 if hours_dict:
-                    data['hours'] = json.dumps(hours_dict)
+                    data['hours'] = json_io.dumps(hours_dict).decode()
                 else:
                     # Try alternative hours display
-                    hours_text_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.fontBodyMedium")
-                    for elem in hours_text_elements:
-                        if "hour" in elem.text.lower() or ":" in elem.text:
-                            data['hours'] = elem.text
+                    for text in hours['body_texts']:
+                        if "hour" in text.lower() or ":" in text:
+                            data['hours'] = text
                             break
                     else:
                         data['hours'] = "N/A"
@@ -280,58 +371,58 @@ class DataProcessor(QRunnable):
                 data['hours'] = "N/A"
             
             # Extract image
-            try:
-                image_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='View all photos']")
-                image_button.click()
-                time.sleep(random.uniform(0.3, 0.7))  # Reduced delay
+            if self.collect_images:
+                try:
+                    if not self.driver.execute_script(_JS_CLICK, "button[aria-label='View all photos']"):
+                        raise LookupError("No photos button")
+                    self.wait_until(EC.presence_of_element_located((By.CSS_SELECTOR, IMAGE_VIEWER_SELECTOR)))
                 
-                # Get the main image
-                main_image = self.driver.find_element(By.CSS_SELECTOR, "button.cX2WmGKJbX__image-viewer-image")
-                image_url = None
+                    # Get the main image
+                    main_image = self.driver.execute_script(_JS_READ_MAIN_IMAGE, IMAGE_VIEWER_SELECTOR)
+                    if main_image is None:
+                        raise LookupError("No main image")
+                    image_url = None
                 
-                if main_image.get_attribute('style'):
-                    image_style = main_image.get_attribute('style')
-                    image_url_match = re.search(r'url\("([^"]+)"\)', image_style)
-                    if image_url_match:
-                        image_url = image_url_match.group(1)
-                else:
-                    image_url = main_image.get_attribute('src')
+                    if main_image.get('style'):
+                        image_url_match = _RE_STYLE_URL.search(main_image['style'])
+                        if image_url_match:
+                            image_url = image_url_match.group(1)
+                    else:
+                        image_url = main_image.get('src')
                 
-                if image_url:
-                    data['image_path'] = self.download_image(image_url, data.get('name', 'unknown'))
-                else:
+                    # Downloaded in enrich()
+                    self.image_url = image_url
                     data['image_path'] = "N/A"
                 
-                # Close the image viewer
-                close_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Close']")
-                close_button.click()
-                time.sleep(0.3)  # Reduced delay
-            except:
+                    # Close the image viewer
+                    self.driver.execute_script(_JS_CLICK, "button[aria-label='Close']")
+                    self.wait_until(EC.invisibility_of_element_located((By.CSS_SELECTOR, IMAGE_VIEWER_SELECTOR)))
+                except:
+                    data['image_path'] = "N/A"
+            else:
                 data['image_path'] = "N/A"
             
             # Extract products/services
             try:
-                menu_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label*='menu']")
-                menu_button.click()
+                if not self.driver.execute_script(_JS_CLICK, "button[aria-label*='menu']"):
+                    raise LookupError("No menu button")
                 time.sleep(random.uniform(0.3, 0.7))  # Reduced delay
                 
                 # Extract menu items or services
+                texts = self.driver.execute_script(_JS_READ_BODY_TEXTS)
                 menu_items = []
-                item_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.fontBodyMedium")
-                for element in item_elements:
-                    if element.text and element.text not in menu_items:
-                        menu_items.append(element.text)
+                seen = set()
+                for text in texts:
+                    if text and text not in seen:
+                        seen.add(text)
+                        menu_items.append(text)
+                        if len(menu_items) >= 10:  # Limit to first 10 items
+                            break
                 
                 if menu_items:
-                    data['products_services'] = json.dumps(menu_items[:10])  # Limit to first 10 items
+                    data['products_services'] = json_io.dumps(menu_items).decode()
                 else:
-                    # Try to get from description
-                    description_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.fontBodyMedium")
-                    descriptions = [elem.text for elem in description_elements if elem.text]
-                    if descriptions:
-                        data['products_services'] = json.dumps(descriptions[:5])  # Limit to first 5 descriptions
-                    else:
-                        data['products_services'] = "N/A"
+                    data['products_services'] = "N/A"
             except:
                 data['products_services'] = "N/A"
             
@@ -341,76 +432,120 @@ class DataProcessor(QRunnable):
             print(f"Error extracting data: {str(e)}")
             return None
     
-    def extract_instagram(self):
-        """Extract Instagram handle from website or description."""
-        # Try to find Instagram in the business description
-        description_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.fontBodyMedium")
-        for element in description_elements:
-            text = element.text
-            instagram_match = re.search(r'instagram\.com/([a-zA-Z0-9_.]+)', text)
+    def _postprocess(self, raw):
+        """Turn the _JS_READ_PLACE result into the entry's static fields."""
+        data = {}
+        
+        # Name
+        data['name'] = raw.get('name') or "N/A"
+        
+        # Phone number
+        phone = raw.get('phone_label')
+        if raw.get('has_phone_button'):
+            if phone and 'Copy phone number' in phone:
+                data['phone'] = phone.replace('Copy phone number ', '')
+            else:
+                data['phone'] = phone or "N/A"
+        elif raw.get('phone_href'):
+            data['phone'] = raw['phone_href'].replace('tel:', '')
+        else:
+            data['phone'] = "N/A"
+        
+        # Website
+        data['website'] = raw.get('website') or "N/A"
+        
+        # Email is looked up from the website in enrich()
+        data['email'] = "N/A"
+        
+        # Instagram
+        body_texts = raw.get('body_texts') or []
+        data['instagram'] = self.extract_instagram(body_texts)
+        
+        # Address
+        address = raw.get('address_label')
+        if raw.get('has_address_button'):
+            if address and 'Copy address' in address:
+                data['address'] = address.replace('Copy address ', '')
+            else:
+                data['address'] = address or "N/A"
+        else:
+            # Try alternative address selectors
+            for text in body_texts:
+                text = text.strip()
+                if text and _RE_DIGIT.search(text) and len(text.split()) > 3:
+                    data['address'] = text
+                    break
+            else:
+                data['address'] = "N/A"
+        
+        return data
+    
+    def extract_instagram(self, description_texts):
+        """Extract Instagram handle from the business description."""
+        for text in description_texts:
+            instagram_match = _RE_INSTAGRAM_URL.search(text or "")
             if instagram_match:
                 return f"https://instagram.com/{instagram_match.group(1)}"
         
-        # Try from website if available
-        website = self.driver.find_elements(By.CSS_SELECTOR, "a[data-tooltip='Open website']")
-        if website:
-            website_url = website[0].get_attribute('href')
-            if website_url and website_url != "N/A":
-                try:
-                    response = requests.get(website_url, timeout=5)
-                    if response.status_code == 200:
-                        from bs4 import BeautifulSoup
-                        soup = BeautifulSoup(response.text, 'html.parser')
-                        
-                        # Look for Instagram links
-                        instagram_links = soup.select('a[href*="instagram.com"]')
-                        if instagram_links:
-                            return instagram_links[0].get('href')
-                        
-                        # Look for Instagram handles in text
-                        instagram_pattern = r'@([a-zA-Z0-9_.]+)'
-                        handles = re.findall(instagram_pattern, soup.get_text())
-                        if handles:
-                            return f"https://instagram.com/{handles[0]}"
-                except:
-                    pass
+        return "N/A"
+    
+    def instagram_from_html(self, html):
+        """Extract Instagram link or handle from the business website's HTML."""
+        if not html:
+            return "N/A"
+        try:
+            # Prefer an Instagram link, else the first handle in the text
+            instagram_link, handle = first_link_or_text_match(html, INSTAGRAM_LINK_SELECTOR, _RE_HANDLE)
+            if instagram_link is not None:
+                return instagram_link
+            if handle:
+                return f"https://instagram.com/{handle.group(1)}"
+        except:
+            pass
         
         return "N/A"
     
-    def download_image(self, image_url, name):
-        """Download and save image."""
+    def save_image(self, content):
+        """Save downloaded image bytes."""
+        if not content:
+            return "N/A"
         try:
-            response = requests.get(image_url, stream=True, timeout=5)
-            if response.status_code == 200:
-                # Save image to a temporary location
-                safe_name = re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')
-                image_path = os.path.join(self.temp_dir, f"{safe_name}_{uuid.uuid4().hex[:8]}.jpg")
-                
-                with open(image_path, 'wb') as f:
-                    for chunk in response.iter_content(1024):
-                        f.write(chunk)
-                
-                return image_path
+            # Save image to a temporary location; exports rename it after the business
+            image_path = os.path.join(self.temp_dir, f"{uuid.uuid4().hex}.jpg")
+            
+            with open(image_path, 'wb') as f:
+                f.write(content)
+            
+            return image_path
         except:
             pass
         
         return "N/A"
 
+def copy_stream(source, dest, buffer_size=65536):
+    """Copy a readable stream into a file via readinto, without allocating a bytes object per block."""
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        count = source.readinto(buffer)
+        if not count:
+            break
+        dest.write(view[:count])
+
 class DataCollectorThread(QThread):
     """Thread for collecting data from Google Maps."""
     
     progress_updated = pyqtSignal(int)
-    data_collected = pyqtSignal(dict)
+    data_batch_ready = pyqtSignal(list)  # Collected entries, emitted in batches
     status_updated = pyqtSignal(str)
     finished = pyqtSignal()
     error_occurred = pyqtSignal(str)
     proxy_rotated = pyqtSignal(str)
     entry_skipped = pyqtSignal(str)  # Signal for skipped entries
-    real_time_update = pyqtSignal(dict)  # Signal for real-time table updates
     connection_status_changed = pyqtSignal(bool)  # Signal for connection status changes
     
     def __init__(self, search_query, location, state, country, num_entries, chromedriver_path=None, 
-                 api_key=None, proxy_manager=None, skip_missing_social=False, parent=None):
+                 api_key=None, proxy_manager=None, skip_missing_social=False, collect_images=False, parent=None):
         super().__init__(parent)
         self.search_query = search_query
         self.location = location
@@ -421,40 +556,37 @@ class DataCollectorThread(QThread):
         self.api_key = api_key
         self.proxy_manager = proxy_manager
         self.skip_missing_social = skip_missing_social
+        self.collect_images = collect_images
         self.is_running = True
         self.is_paused = False  # For pausing when connection is poor
         self.temp_dir = os.path.join(os.path.expanduser('~'), 'temp_data_collector')
         os.makedirs(self.temp_dir, exist_ok=True)
-        self.email_extractor = EmailExtractor()
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0)",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:124.0) Gecko/20100101 Firefox/124.0)"
-        ]
+        # One keep-alive pool for every website, email and image fetch in this run
+        self.session = create_pooled_session()
+        self.session.headers.update({'User-Agent': random.choice(USER_AGENTS)})
+        self.email_extractor = EmailExtractor(session=self.session)
         self.request_count = 0
         self.last_request_time = 0
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)  # Process up to 4 entries in parallel
+        self.executor = None  # Created per run; runs up to 4 I/O stages in parallel
+        self.fetcher = None  # Created per run; overlaps website and image downloads
+        self.driver_pool = None  # Created per run; warm drivers for loading entries in parallel
+        self.pool_drivers = []  # Every pooled driver, so all are quit at the end of the run
+        self.results_queue = queue.Queue()  # Worker results, drained by this thread
+        self.pending_results = 0  # Entries dispatched whose result has not been handled yet
+        self.worker_futures = set()  # Pool futures not yet finished
         self.collected_count = 0
         self.skipped_count = 0
+        self.last_progress = -1  # Last percentage sent to the UI
         self.processed_count = 0
         self.max_to_process = self.num_entries * 5  # Process up to 5x the target to find enough valid entries
         self.internet_connected = True  # Assume connected initially
-        
-        # Register cleanup on exit
-        import atexit
-        atexit.register(self.cleanup)
-    
-    def cleanup(self):
-        """Clean up temporary files."""
-        try:
-            if os.path.exists(self.temp_dir):
-                import shutil
-                shutil.rmtree(self.temp_dir)
-        except:
-            pass
+        # Collected entries are written here as they arrive rather than kept for a final dump
+        self.stream_path = os.path.join(self.temp_dir, f"collected_{uuid.uuid4().hex[:8]}.jsonl")
+        self.stream = None
+        self.data_buffer = []  # Collected entries not yet emitted to the UI
+        self.last_flush = time.monotonic()
+        # temp_dir is shared by every run and removed once by the main window's
+        # exit cleanup, since collected image paths must outlive this thread
     
     def rate_limit(self):
         """Implement rate limiting to avoid detection."""
@@ -476,10 +608,6 @@ class DataCollectorThread(QThread):
         
         self.last_request_time = time.time()
     
-    def rotate_user_agent(self):
-        """Rotate user agent."""
-        return random.choice(self.user_agents)
-    
     def setup_driver(self):
         """Setup WebDriver with anti-detection measures and optimizations."""
         browser_manager = BrowserManager(
@@ -494,12 +622,31 @@ class DataCollectorThread(QThread):
             if proxy:
                 self.proxy_rotated.emit(f"Using proxy: {proxy}")
         
-        driver = browser_manager.create_driver(proxy=proxy)
+        driver = browser_manager.create_driver(user_agent=random.choice(USER_AGENTS), proxy=proxy)
         return driver, proxy
     
+    def create_driver_pool(self, size):
+        """Start up to size warm drivers; returns their queue, or None if none started."""
+        driver_pool = queue.Queue()
+        for _ in range(size):
+            try:
+                pooled_driver, _ = self.setup_driver()
+            except Exception as e:
+                self.status_updated.emit(f"Could not start pooled driver: {str(e)}")
+                break
+            self.pool_drivers.append(pooled_driver)
+            driver_pool.put(pooled_driver)
+        return driver_pool if self.pool_drivers else None
+    
     def run(self):
         """Main thread execution method."""
         driver = None
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        self.pending_results = 0
+        self.worker_futures = set()
+        self.fetcher = async_fetch.BackgroundFetcher(headers={'User-Agent': self.session.headers['User-Agent']},
+                                                     session=self.session)
+        self.stream = FileManager.open_stream(self.stream_path)
         try:
             self.status_updated.emit("Initializing data collection...")
             
@@ -509,6 +656,7 @@ class DataCollectorThread(QThread):
                 api_results = self.collect_via_api()
                 if api_results:
                     self.status_updated.emit("API collection completed successfully")
+                    self.flush_data_buffer()
                     self.finished.emit()
                     return
             
@@ -530,20 +678,9 @@ class DataCollectorThread(QThread):
             self.status_updated.emit("Waiting for search results...")
             
             # Try multiple selectors for search results
-            selectors = [
-                (By.CSS_SELECTOR, "div[role='article']"),
-                (By.CSS_SELECTOR, "div.section-result"),
-                (By.CSS_SELECTOR, "div.place-result"),
-                (By.CSS_SELECTOR, "div[jsaction*='mouseover']"),
-                (By.CSS_SELECTOR, "div[aria-label*='result']"),
-                (By.CSS_SELECTOR, "div.m6QErb.DxyBCb.kA9KIf.dS8AEf.ecceSd"),
-                (By.CSS_SELECTOR, "div[jscontroller='AtSb']"),
-                (By.CSS_SELECTOR, "div[aria-label*='Results for']")
-            ]
-            
             found_results = False
             selector_by, selector_value = None, None
-            for by, value in selectors:
+            for by, value in RESULT_SELECTORS:
                 try:
                     WebDriverWait(driver, 10).until(  # Reduced timeout
                         EC.presence_of_element_located((by, value))
@@ -575,8 +712,12 @@ class DataCollectorThread(QThread):
                 self.error_occurred.emit(f"Timeout while waiting for search results to load. Debug information saved to {debug_file}")
                 return
             
+            self.status_updated.emit("Starting parallel drivers...")
+            self.driver_pool = self.create_driver_pool(DRIVER_POOL_SIZE)
+            
             self.status_updated.emit("Starting data collection...")
             consecutive_errors = 0
+            results = []
             
             while self.collected_count < self.num_entries and self.processed_count < self.max_to_process and self.is_running and consecutive_errors < 3:
                 # Check if we should pause due to poor internet connection
@@ -599,8 +740,9 @@ class DataCollectorThread(QThread):
                     # Rate limiting
                     self.rate_limit()
                     
-                    # Get all result elements using the found selector
-                    results = driver.find_elements(selector_by, selector_value)
+                    # Re-query the result list only once the cached one is used up
+                    if self.processed_count >= len(results):
+                        results = driver.find_elements(selector_by, selector_value)
                     
                     if self.processed_count >= len(results):
                         # Load more results if needed
@@ -622,32 +764,48 @@ class DataCollectorThread(QThread):
                     
                     self.status_updated.emit(f"Processing batch of {batch_size} entries...")
                     
-                    # Create and run worker threads for this batch
-                    workers = []
-                    for i in range(batch_size):
-                        result_index = self.processed_count + i
-                        worker = DataProcessor(
+                    # Browser work stays on this thread; I/O stages overlap on the pool
+                    batch = results[self.processed_count:self.processed_count + batch_size]
+                    scraped = []  # (processor, data) pairs clicked open on this thread
+                    for result_index, result_element in enumerate(batch, self.processed_count):
+                        processor = DataProcessor(
                             driver, 
-                            results[result_index], 
+                            result_element, 
                             result_index, 
                             self.temp_dir, 
                             self.email_extractor,
-                            self.skip_missing_social
+                            self.skip_missing_social,
+                            self.session,
+                            self.fetcher,
+                            self.driver_pool,
+                            self.collect_images
                         )
-                        worker.signals.data_ready.connect(self.handle_data_ready)
-                        worker.signals.error.connect(self.handle_worker_error)
-                        worker.signals.skipped.connect(self.handle_entry_skipped)
-                        workers.append(worker)
+                        if self.driver_pool is not None:
+                            # Entries with a place link load on their own driver in parallel
+                            entry_info = processor.extract_info_from_result()
+                            if entry_info.get('href'):
+                                self.dispatch(processor.process, entry_info)
+                                continue
+                        kind, payload = processor.scrape()
+                        if kind == RESULT_DATA:
+                            scraped.append((processor, payload))
+                        else:
+                            self.pending_results += 1
+                            self.results_queue.put((kind, payload))
                     
-                    # Start all workers
-                    for worker in workers:
-                        self.thread_pool.start(worker)
+                    # Fetch the clicked entries' websites together, then enrich each
+                    websites = [payload['website'] for _, payload in scraped if DataProcessor.needs_website_page(payload)]
+                    pages_future = self.fetcher.fetch_all_text(websites, timeout=5) if websites else None
+                    for processor, payload in scraped:
+                        self.dispatch(processor.enrich, payload, pages_future)
                     
-                    # Wait for all workers to complete
-                    self.thread_pool.waitForDone(30000)  # 30 seconds timeout
+                    # Handle whatever has finished, waiting only while more than one
+                    # batch is still in flight, so stragglers overlap the next batch
+                    self.drain_worker_results(max_pending=4, timeout=30)
+                    self.flush_data_buffer()
                     
                     self.processed_count += batch_size
-                    self.progress_updated.emit(int((self.collected_count / self.num_entries) * 100))
+                    self.report_progress(self.collected_count)
                     self.status_updated.emit(f"Processed {self.processed_count} entries, collected {self.collected_count} valid entries")
                     
                     # Rotate IP periodically if using proxy manager
@@ -661,14 +819,21 @@ class DataCollectorThread(QThread):
                 except Exception as e:
                     self.status_updated.emit(f"Error processing batch: {str(e)}")
                     consecutive_errors += 1
+                    results = []  # The cached elements may have gone stale
                     continue
             
+            # Wait for the entries still in flight, then settle any stragglers
+            if self.is_running:
+                self.drain_worker_results(max_pending=0, timeout=30)
+            self.finish_worker_results()
+            
             # Check if we collected enough entries
             if self.collected_count < self.num_entries:
                 self.status_updated.emit(f"Warning: Only collected {self.collected_count} of {self.num_entries} requested entries.")
                 if self.skip_missing_social:
                     self.status_updated.emit(f"Consider disabling 'Skip entries without website or Instagram' to collect more entries.")
             
+            self.flush_data_buffer()
             self.finished.emit()
             
         except WebDriverException as e:
@@ -681,11 +846,100 @@ class DataCollectorThread(QThread):
         except Exception as e:
             self.error_occurred.emit(f"Unexpected error: {str(e)}")
         finally:
-            if driver is not None:
+            # Workers still use the fetcher and session, so they get to finish before those close
+            self.shutdown_workers()
+            self.flush_data_buffer()
+            self.stream.close()
+            self.fetcher.close()
+            self.session.close()
+            for pooled_driver in [driver] + self.pool_drivers:
+                if pooled_driver is None:
+                    continue
                 try:
-                    driver.quit()
+                    pooled_driver.quit()
                 except:
                     pass
+            self.pool_drivers = []
+            self.driver_pool = None
+    
+    def dispatch(self, stage, *args):
+        """Run a pipeline stage, on the pool if it releases the GIL, queueing its result."""
+        self.pending_results += 1
+        if getattr(stage, 'releases_gil', False):
+            future = self.executor.submit(stage, *args)
+            self.worker_futures.add(future)
+            future.add_done_callback(self.queue_worker_result)
+        else:
+            self.results_queue.put(stage(*args))
+    
+    def queue_worker_result(self, future):
+        """Hand a finished worker's result to the collection thread."""
+        self.worker_futures.discard(future)
+        if future.cancelled():
+            return  # Counted once by cancel_queued_workers rather than reported per entry
+        try:
+            self.results_queue.put(future.result())
+        except Exception as e:
+            self.results_queue.put((RESULT_ERROR, f"Worker failed: {str(e)}"))
+    
+    def cancel_queued_workers(self):
+        """Cancel pool work that has not started, reporting how many entries were dropped."""
+        cancelled = sum(1 for future in list(self.worker_futures) if future.cancel())
+        self.pending_results -= cancelled
+        if cancelled:
+            self.status_updated.emit(f"Cancelled {cancelled} queued entries.")
+    
+    def shutdown_workers(self):
+        """Cancel queued pool work and wait up to WORKER_SHUTDOWN_TIMEOUT for running work."""
+        self.cancel_queued_workers()
+        concurrent.futures.wait(list(self.worker_futures), timeout=WORKER_SHUTDOWN_TIMEOUT)
+        self.executor.shutdown(wait=False)
+    
+    def finish_worker_results(self):
+        """Settle dispatched entries: cancel queued work, wait a bounded time for running work, handle all results."""
+        self.shutdown_workers()
+        while True:
+            try:
+                result = self.results_queue.get_nowait()
+            except queue.Empty:
+                break
+            if result is not None:  # Skip a stop() sentinel
+                self.handle_worker_result(result)
+    
+    def drain_worker_results(self, max_pending, timeout):
+        """Handle finished worker results until at most max_pending are outstanding.
+        
+        Results already waiting are always handled. The call only blocks while
+        more than max_pending are in flight, and stops waiting after timeout
+        seconds or a stop request. Stragglers stay counted in pending_results
+        and are handled by a later drain or by finish_worker_results.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                result = self.results_queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if self.pending_results <= max_pending or remaining <= 0:
+                    break
+                try:
+                    result = self.results_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if result is None:  # Sentinel from stop()
+                break
+            self.handle_worker_result(result)
+    
+    def handle_worker_result(self, result):
+        """Handle one (kind, payload) result from a pipeline stage."""
+        self.pending_results -= 1
+        kind, payload = result
+        if kind == RESULT_DATA:
+            self.handle_data_ready(payload)
+        elif kind == RESULT_SKIPPED:
+            self.handle_entry_skipped(payload)
+        else:
+            self.handle_worker_error(payload)
     
     def handle_data_ready(self, data):
         """Handle data ready signal from worker."""
@@ -694,14 +948,33 @@ class DataCollectorThread(QThread):
         data['location'] = self.location
         data['state'] = self.state
         data['search_query'] = self.search_query
-        
-        # Emit signals for both real-time update and data collection
-        self.real_time_update.emit(data)
-        self.data_collected.emit(data)
+        self.stream.write_line(data)
+        self.buffer_data(data)
         
         # Update counters
         self.collected_count += 1
-        self.progress_updated.emit(int((self.collected_count / self.num_entries) * 100))
+        self.report_progress(self.collected_count)
+    
+    def report_progress(self, collected):
+        """Emit the collected percentage, but only when it has changed."""
+        percent = collected * 100 // self.num_entries
+        if percent != self.last_progress:
+            self.last_progress = percent
+            self.progress_updated.emit(percent)
+    
+    def buffer_data(self, data):
+        """Queue a collected entry for the UI, emitting once a batch is full or has waited long enough."""
+        self.data_buffer.append(data)
+        if (len(self.data_buffer) >= DATA_BATCH_SIZE
+                or time.monotonic() - self.last_flush >= DATA_FLUSH_INTERVAL):
+            self.flush_data_buffer()
+    
+    def flush_data_buffer(self):
+        """Emit any collected entries not yet sent to the UI."""
+        self.last_flush = time.monotonic()
+        if self.data_buffer:
+            batch, self.data_buffer = self.data_buffer, []
+            self.data_batch_ready.emit(batch)
     
     def handle_worker_error(self, error_message):
         """Handle worker error signal."""
@@ -729,78 +1002,90 @@ class DataCollectorThread(QThread):
             return False
             
         collected_count = 0
-        for place in places:
-            if not self.is_running or collected_count >= self.num_entries:
-                break
-                
-            place_id = place.get('place_id')
-            if not place_id:
-                continue
+        # Details, email and photo lookups are independent per place, so they overlap;
+        # the API's token bucket keeps the request rate under the Places quota
+        with concurrent.futures.ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            futures = [executor.submit(self.fetch_api_entry, api, place)
+                       for place in places if place.get('place_id')]
+            for future in concurrent.futures.as_completed(futures):
+                if not self.is_running or collected_count >= self.num_entries:
+                    for pending in futures:
+                        pending.cancel()
+                    break
                 
-            details = api.get_place_details(place_id)
-            if not details:
-                continue
+                try:
+                    data = future.result()
+                except Exception:
+                    continue
+                if not data:
+                    continue
                 
-            # Extract data from API response
-            data = {
-                'country': self.country,
-                'location': self.location,
-                'state': self.state,
-                'search_query': self.search_query,
-                'name': details.get('name', 'N/A'),
-                'phone': details.get('formatted_phone_number', 'N/A'),
-                'website': details.get('website', 'N/A'),
-                'email': 'N/A',  # API doesn't provide emails
-                'instagram': 'N/A',  # API doesn't provide Instagram
-                'address': place.get('formatted_address', 'N/A'),
-                'hours': json.dumps(details.get('opening_hours', {}).get('weekday_text', [])),
-                'products_services': 'N/A',  # API doesn't provide products/services
-                'image_path': 'N/A'
-            }
-            
-            # Extract email from website if available
-            if data['website'] != 'N/A':
-                data['email'] = self.email_extractor.extract_emails(data['website'])[0]
-            
-            # Download first image if available
-            photos = details.get('photos', [])
-            if photos:
-                photo_reference = photos[0].get('photo_reference')
-                if photo_reference:
-                    image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_reference}&key={self.api_key}"
-                    data['image_path'] = self.download_image(image_url, data.get('name', 'unknown'))
-            
-            # Check if we should skip this entry
-            if self.skip_missing_social and data.get('website') == "N/A" and data.get('instagram') == "N/A":
-                self.skipped_count += 1
-                self.entry_skipped.emit(f"Skipped entry {collected_count + 1} ({data.get('name', 'Unknown')}) - Address: {data.get('address', 'N/A')} - No website or Instagram")
-            else:
-                # Emit signals for both real-time update and data collection
-                self.real_time_update.emit(data)
-                self.data_collected.emit(data)
-                collected_count += 1
-                self.progress_updated.emit(int((collected_count / self.num_entries) * 100))
-                self.status_updated.emit(f"Collected {collected_count} of {self.num_entries} entries via API")
-            
-            # Rate limiting for API
-            time.sleep(random.uniform(0.1, 0.3))  # Reduced delay
+                # Check if we should skip this entry
+                if self.skip_missing_social and data.get('website') == "N/A" and data.get('instagram') == "N/A":
+                    self.skipped_count += 1
+                    self.entry_skipped.emit(f"Skipped entry {collected_count + 1} ({data.get('name', 'Unknown')}) - Address: {data.get('address', 'N/A')} - No website or Instagram")
+                else:
+                    self.stream.write_line(data)
+                    self.buffer_data(data)
+                    collected_count += 1
+                    self.report_progress(collected_count)
+                    self.status_updated.emit(f"Collected {collected_count} of {self.num_entries} entries via API")
         
         return True
     
-    def download_image(self, image_url, name):
+    def fetch_api_entry(self, api, place):
+        """Build one entry from a Places search result; runs on the API worker pool."""
+        details = api.get_place_details(place['place_id'])
+        if not details:
+            return None
+            
+        # Extract data from API response
+        data = {
+            'country': self.country,
+            'location': self.location,
+            'state': self.state,
+            'search_query': self.search_query,
+            'name': details.get('name', 'N/A'),
+            'phone': details.get('formatted_phone_number', 'N/A'),
+            'website': details.get('website', 'N/A'),
+            'email': 'N/A',  # API doesn't provide emails
+            'instagram': 'N/A',  # API doesn't provide Instagram
+            'address': place.get('formatted_address', 'N/A'),
+            'hours': json_io.dumps(details.get('opening_hours', {}).get('weekday_text', [])).decode(),
+            'products_services': 'N/A',  # API doesn't provide products/services
+            'image_path': 'N/A'
+        }
+        
+        # Extract email from website if available
+        if data['website'] != 'N/A':
+            data['email'] = self.email_extractor.extract_emails(data['website'])[0]
+        
+        # Download first image if available
+        photos = details.get('photos', []) if self.collect_images else []
+        if photos:
+            photo_reference = photos[0].get('photo_reference')
+            if photo_reference:
+                image_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=400&photoreference={photo_reference}&key={self.api_key}"
+                with api.rate_limiter:
+                    data['image_path'] = self.download_image(image_url)
+        
+        return data
+    
+    def download_image(self, image_url):
         """Download and save image."""
         try:
-            response = requests.get(image_url, stream=True, timeout=5)
-            if response.status_code == 200:
-                # Save image to a temporary location
-                safe_name = re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')
-                image_path = os.path.join(self.temp_dir, f"{safe_name}_{uuid.uuid4().hex[:8]}.jpg")
-                
-                with open(image_path, 'wb') as f:
-                    for chunk in response.iter_content(1024):
-                        f.write(chunk)
-                
-                return image_path
+            # Closing the streamed response returns its connection to the pool
+            with self.session.get(image_url, stream=True, timeout=(3, 15)) as response:
+                if response.status_code == 200:
+                    # Save image to a temporary location; exports rename it after the business
+                    image_path = os.path.join(self.temp_dir, f"{uuid.uuid4().hex}.jpg")
+                    
+                    # Copy straight from the socket to the file through one reused buffer
+                    response.raw.decode_content = True
+                    with open(image_path, 'wb') as f:
+                        copy_stream(response.raw, f)
+                    
+                    return image_path
         except:
             pass
         
@@ -809,6 +1094,7 @@ class DataCollectorThread(QThread):
     def stop(self):
         """Stop the data collection process."""
         self.is_running = False
+        self.results_queue.put(None)  # Wake the collection thread if it is waiting on workers
 
 class GooglePlacesAPI:
     """Wrapper for Google Places API."""
@@ -816,12 +1102,14 @@ class GooglePlacesAPI:
     def __init__(self, api_key):
         self.api_key = api_key
         self.base_url = "https://maps.googleapis.com/maps/api/place"
-        self.session = requests.Session()
+        self.session = create_pooled_session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
         })
         # Set timeout for requests
         self.session.timeout = 10
+        # Spaces API calls without blocking on a fixed sleep after each entry
+        self.rate_limiter = TokenBucket(rate=API_REQUESTS_PER_SECOND)
     
     def search_places(self, query, location, radius=5000):
         """Search for places using Google Places API."""
@@ -833,9 +1121,10 @@ class GooglePlacesAPI:
         }
         
         try:
-            response = self.session.get(endpoint, params=params)
+            with self.rate_limiter:
+                response = self.session.get(endpoint, params=params)
             if response.status_code == 200:
-                results = response.json().get('results', [])
+                results = json_io.loads(response.content).get('results', [])
                 return results
         except Exception as e:
             print(f"API search error: {str(e)}")
@@ -851,9 +1140,10 @@ class GooglePlacesAPI:
         }
         
         try:
-            response = self.session.get(endpoint, params=params)
+            with self.rate_limiter:
+                response = self.session.get(endpoint, params=params)
             if response.status_code == 200:
-                return response.json().get('result', {})
+                return json_io.loads(response.content).get('result', {})
         except Exception as e:
             print(f"API details error: {str(e)}")
         return {}
\ No newline at end of file
@@ -1,10 +1,90 @@
 """Data processing utilities."""
 
 import re
+import sys
 import json
 import phonenumbers
-import requests
-from typing import Dict, List, Any
+import pandas as pd
+import concurrent.futures
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any
+
+from utils.network import create_pooled_session
+
+# Fields kept by clean_data_entry / clean_data, in output order
+CLEANED_FIELDS = ['name', 'phone', 'email', 'website', 'instagram', 'address',
+                  'country', 'state', 'location', 'hours', 'products_services', 'image_path']
+
+# Website checks are latency-bound, so they run this many at a time over one keep-alive pool
+VALIDATION_WORKERS = 32
+_SESSION = create_pooled_session(pool_connections=VALIDATION_WORKERS, pool_maxsize=VALIDATION_WORKERS)
+
+_RE_PHONE_JUNK = re.compile(r'[^\d+]')
+_RE_VALID_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_URL_SCHEME = re.compile(r'https?://')
+_RE_LEADING_AT = re.compile(r'^@')
+
+def _clean_column(df: pd.DataFrame, column: str, clean) -> None:
+    """Apply a vectorized string cleaner to the non-'N/A' values of a column."""
+    values = df[column]
+    present = values != 'N/A'
+    if present.any():
+        # Non-string values come back as NaN from .str and keep their original value
+        df.loc[present, column] = clean(values[present]).fillna(values[present])
+
+def _clean_phone(phone: pd.Series) -> pd.Series:
+    # Remove all non-digit characters except for leading '+'
+    phone = phone.str.replace(_RE_PHONE_JUNK, '', regex=True)
+    # Default to Nigeria country code if no country code is present
+    needs_code = (phone.str.len() >= 10) & ~phone.str.startswith('+', na=False)
+    with_code = ('+234' + phone).where(phone.str.len() != 10, '+234' + phone.str[-10:])
+    return phone.where(~needs_code, with_code)
+
+def _clean_instagram(instagram: pd.Series) -> pd.Series:
+    instagram = instagram.str.strip()
+    handle = instagram.str.replace(_RE_LEADING_AT, '', regex=True)
+    return instagram.where(instagram.str.match(_RE_URL_SCHEME, na=False), 'https://instagram.com/' + handle)
+
+def _squeeze_text(value: str) -> str:
+    # Remove extra spaces within the value
+    return ' '.join(value.split())
+
+def _clean_phone_text(phone: str) -> str:
+    # Remove all non-digit characters except for leading '+'
+    phone = _RE_PHONE_JUNK.sub('', phone)
+    # Ensure country code is present if it's a valid phone number
+    if phone and not phone.startswith('+') and len(phone) >= 10:
+        # Default to Nigeria country code if no country code is present
+        phone = f"+234{phone[-10:]}" if len(phone) == 10 else f"+234{phone}"
+    return phone
+
+def _clean_website_text(website: str) -> str:
+    website = website.strip()
+    # Ensure URL has proper format
+    return website if website.startswith(('http://', 'https://')) else 'https://' + website
+
+def _clean_instagram_text(instagram: str) -> str:
+    instagram = instagram.strip()
+    # Ensure Instagram URL has proper format
+    if instagram.startswith(('http://', 'https://')):
+        return instagram
+    return f"https://instagram.com/{instagram[1:] if instagram.startswith('@') else instagram}"
+
+# Per-field cleaners applied by clean_data_entry to values other than 'N/A', in CLEANED_FIELDS order
+def _strip_shared(value: str) -> str:
+    # Country/state/location repeat on nearly every row, so rows share one interned copy
+    return sys.intern(value.strip())
+
+_ENTRY_CLEANERS = (
+    ('name', _squeeze_text),
+    ('phone', _clean_phone_text),
+    ('email', lambda email: email.strip().lower()),
+    ('website', _clean_website_text),
+    ('instagram', _clean_instagram_text),
+    ('address', _squeeze_text),
+) + tuple((field, _strip_shared) for field in ['country', 'state', 'location']
+) + tuple((field, str.strip) for field in ['hours', 'products_services', 'image_path'])
 
 class DataProcessor:
     """Processes and validates collected data."""
@@ -13,73 +93,47 @@ class DataProcessor:
     def clean_data_entry(data: Dict[str, Any]) -> Dict[str, Any]:
         """Clean a single data entry."""
         cleaned = {}
+        for field, clean in _ENTRY_CLEANERS:
+            value = data.get(field, 'N/A')
+            cleaned[field] = clean(value) if value != 'N/A' and isinstance(value, str) else value
+        return cleaned
+    
+    @staticmethod
+    def clean_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Clean and de-duplicate a list of entries in one vectorized pass.
         
-        # Clean name
-        name = data.get('name', 'N/A')
-        if name != 'N/A':
-            name = name.strip()
-            # Remove extra spaces within the name
-            name = ' '.join(name.split())
-        cleaned['name'] = name
-        
-        # Clean phone number
-        phone = data.get('phone', 'N/A')
-        if phone != 'N/A':
-            # Remove all non-digit characters except for leading '+'
-            phone = re.sub(r'[^\d+]', '', phone)
-            # Ensure country code is present if it's a valid phone number
-            if phone and not phone.startswith('+') and len(phone) >= 10:
-                # Default to Nigeria country code if no country code is present
-                phone = f"+234{phone[-10:]}" if len(phone) == 10 else f"+234{phone}"
-        cleaned['phone'] = phone
-        
-        # Clean email
-        email = data.get('email', 'N/A')
-        if email != 'N/A':
-            email = email.strip().lower()
-        cleaned['email'] = email
-        
-        # Clean website
-        website = data.get('website', 'N/A')
-        if website != 'N/A':
-            website = website.strip()
-            # Ensure URL has proper format
-            if not website.startswith(('http://', 'https://')):
-                website = 'https://' + website
-        cleaned['website'] = website
-        
-        # Clean Instagram
-        instagram = data.get('instagram', 'N/A')
-        if instagram != 'N/A':
-            instagram = instagram.strip()
-            # Ensure Instagram URL has proper format
-            if not instagram.startswith(('http://', 'https://')):
-                if instagram.startswith('@'):
-                    instagram = f"https://instagram.com/{instagram[1:]}"
-                else:
-                    instagram = f"https://instagram.com/{instagram}"
-        cleaned['instagram'] = instagram
+        Gives the same result as clean_data_entry on each entry followed by
+        remove_duplicates.
+        """
+        if not data:
+            return []
         
-        # Clean address
-        address = data.get('address', 'N/A')
-        if address != 'N/A':
-            address = address.strip()
-            # Remove extra spaces within the address
-            address = ' '.join(address.split())
-        cleaned['address'] = address
+        df = pd.DataFrame.from_records(data).reindex(columns=CLEANED_FIELDS).fillna('N/A')
         
-        # Clean other fields
+        squeeze = lambda s: s.str.replace(_RE_WHITESPACE, ' ', regex=True).str.strip()
+        _clean_column(df, 'name', squeeze)
+        _clean_column(df, 'phone', _clean_phone)
+        _clean_column(df, 'email', lambda s: s.str.strip().str.lower())
+        _clean_column(df, 'website', lambda s: s.str.strip().where(
+            s.str.strip().str.match(_RE_URL_SCHEME, na=False), 'https://' + s.str.strip()))
+        _clean_column(df, 'instagram', _clean_instagram)
+        _clean_column(df, 'address', squeeze)
         for field in ['country', 'state', 'location', 'hours', 'products_services', 'image_path']:
-            value = data.get(field, 'N/A')
-            if value != 'N/A' and isinstance(value, str):
-                value = value.strip()
-            cleaned[field] = value
+            _clean_column(df, field, lambda s: s.str.strip())
         
-        return cleaned
+        # Drop duplicates on normalized name and address
+        keys = pd.DataFrame({
+            'name': df['name'].astype(str).str.strip().str.lower(),
+            'address': df['address'].astype(str).str.strip().str.lower(),
+        })
+        df = df[~keys.duplicated()]
+        
+        return df.to_dict('records')
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def validate_phone_number(phone: str) -> bool:
-        """Validate a phone number."""
+        """Validate a phone number. Results are cached per string, since chains repeat numbers."""
         try:
             if phone and phone != 'N/A':
                 parsed_number = phonenumbers.parse(phone, None)
@@ -89,13 +143,13 @@ class DataProcessor:
             return False
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def validate_email_address(email: str) -> bool:
         """Validate an email address."""
         if not email or email == 'N/A':
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _RE_VALID_EMAIL.match(email) is not None
     
     @staticmethod
     def validate_website_url(website: str) -> bool:
@@ -104,32 +158,28 @@ class DataProcessor:
             return False
         
         try:
-            response = requests.head(website, timeout=5)
+            response = _SESSION.head(website, timeout=5, allow_redirects=False)
             return response.status_code < 400
         except:
             return False
     
+    @staticmethod
+    def validate_website_urls(websites: Iterable[str]) -> Dict[str, bool]:
+        """Validate many website URLs concurrently; returns {url: is_valid}."""
+        websites = list(dict.fromkeys(websites))
+        if not websites:
+            return {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(VALIDATION_WORKERS, len(websites))) as executor:
+            return dict(zip(websites, executor.map(DataProcessor.validate_website_url, websites)))
+    
     @staticmethod
     def remove_duplicates(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate entries from data list."""
-        unique_entries = set()
-        cleaned_data = []
-        
+        # Keyed by normalized name and address; setdefault keeps the first entry in its original position
+        unique_entries = {}
         for item in data:
-            # Create a unique key based on name and address
-            name = item.get('name', '').strip().lower()
-            address = item.get('address', '').strip().lower()
-            unique_key = (name, address)
-            
-            # Skip if this is a duplicate entry
-            if unique_key in unique_entries:
-                continue
-            
-            # Add to unique entries set and cleaned data
-            unique_entries.add(unique_key)
-            cleaned_data.append(item)
-        
-        return cleaned_data
+            unique_entries.setdefault((item.get('name', '').strip().lower(), item.get('address', '').strip().lower()), item)
+        return list(unique_entries.values())
     
     @staticmethod
     def validate_data(data: List[Dict[str, Any]], settings: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -137,6 +187,12 @@ class DataProcessor:
         validated_count = 0
         validated_data = []
         
+        # Check every website up front instead of one blocking request per item
+        website_ok = {}
+        if settings.get('validate_website'):
+            website_ok = DataProcessor.validate_website_urls(
+                item.get('website') for item in data if item.get('website') != 'N/A')
+        
         for i, item in enumerate(data):
             validated_item = item.copy()
             
@@ -152,7 +208,7 @@ class DataProcessor:
             
             # Validate website
             if settings.get('validate_website') and item.get('website') != 'N/A':
-                if not DataProcessor.validate_website_url(item.get('website')):
+                if not website_ok.get(item.get('website')):
                     validated_item['website'] = 'N/A (Invalid)'
             
             validated_data.append(validated_item)
@@ -1,19 +1,38 @@
 # core/web_scraping.py
 """Web scraping logic for Google search results."""
 
+import os
 import time
 import random
 import re
+import asyncio
 import threading
 import concurrent.futures
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Set
 from PyQt5.QtCore import QThread, pyqtSignal, QObject, QRunnable
-from bs4 import BeautifulSoup
 import requests
 
 from models import ScrapedItem
-from config import ECOM_PLATFORM_QUERIES
-from utils.data_extraction import DataExtractor
+from config import ECOM_PLATFORM_QUERIES, DEFAULT_HEADERS
+from utils.data_extraction import DataExtractor, HtmlDocument, page_link_hrefs
+from utils.network import TokenBucket, create_pooled_session
+from core import async_fetch
+
+# Keep-alive pool sized for the site-visit thread pool; many results share hosts
+SITE_POOL_SIZE = 64
+
+# SERP pages kept per run, most recently used last, keyed on (query, page index)
+SERP_CACHE_SIZE = 256
+
+# Site pages are HTML; anything larger than this is cut off or, if declared larger, skipped
+MAX_PAGE_BYTES = 512 * 1024
+
+# Shared by fetch_url callers that do not bring their own session
+_SESSION = create_pooled_session(pool_connections=SITE_POOL_SIZE, pool_maxsize=SITE_POOL_SIZE)
+
+# One header dict per user agent, built once; requests and aiohttp copy what they are given
+_HEADER_POOL = [{"User-Agent": ua, "Accept-Language": "en-US,en;q=0.9"} for ua in DEFAULT_HEADERS]
 
 class WebScrapeWorkerSignals(QObject):
     """Signals for web scraping worker."""
@@ -37,9 +56,35 @@ class WebScrapeWorker(QRunnable):
         self._total_count = 0
         self._paused = threading.Event()
         self._paused.clear()  # Not paused initially
+        # One pooled session for every SERP and site fetch in this run
+        self._session = create_pooled_session(pool_connections=SITE_POOL_SIZE, pool_maxsize=SITE_POOL_SIZE)
+        self._session.headers.update(random_header())
+        # HTML parsing is CPU-bound, so it runs in worker processes
+        self._parse_pool = None
+        # SERP requests are spaced by the configured delay range instead of sleeping per page
+        mean_delay = (params.get("delay_min", 0.5) + params.get("delay_max", 1.5)) / 2
+        self._serp_bucket = TokenBucket(rate=1.0 / max(mean_delay, 0.01))
+        # Queries that differ only by suffix often share SERP pages; both fetch paths use this cache
+        self._serp_cache: "OrderedDict[Tuple[str, int], Tuple[str, ...]]" = OrderedDict()
         
     def stop(self):
         self._stop.set()
+    
+    def _cached_serp_links(self, qtext, page_idx):
+        """Links of a SERP page fetched earlier in this run, or None."""
+        key = (qtext, page_idx)
+        with self._lock:
+            links = self._serp_cache.get(key)
+            if links is not None:
+                self._serp_cache.move_to_end(key)
+            return links
+    
+    def _cache_serp_links(self, qtext, page_idx, links):
+        """Remember a successfully fetched SERP page, evicting the least recently used."""
+        with self._lock:
+            self._serp_cache[(qtext, page_idx)] = tuple(links)
+            if len(self._serp_cache) > SERP_CACHE_SIZE:
+                self._serp_cache.popitem(last=False)
         
     def pause(self):
         self._paused.set()
@@ -54,83 +99,140 @@ class WebScrapeWorker(QRunnable):
         if self._stop.is_set():
             return None
             
-        try:
-            # Check if we're paused
-            while self._paused.is_set() and not self._stop.is_set():
-                time.sleep(0.5)
-                
-            if self._stop.is_set():
-                return None
-                
-            self.signals.progress.emit(f"Scanning: {site_url}")
-            html = fetch_url(site_url, timeout=15)
-            if not html:
-                return None
-                
-            # First check if we can extract an email - if not, skip this site
-            emails = DataExtractor.extract_emails(html)
-            if not emails:
-                return None
-                
-            soup = BeautifulSoup(html, "lxml")
-            item = ScrapedItem()
-            item.website = site_url
-            item.location = self.params["location"]
-            item.source_page = page_no
+        # Check if we're paused
+        while self._paused.is_set() and not self._stop.is_set():
+            time.sleep(0.5)
             
-            # Add email (first one found)
-            item.email = emails[0]
+        if self._stop.is_set():
+            return None
             
-            # Detect platform & e-commerce hints
-            item.platform = DataExtractor.detect_platform(html)
+        self.signals.progress.emit(f"Scanning: {site_url}")
+        html = fetch_url(site_url, timeout=15, session=self._session)
+        return self._process_html(page_no, site_url, html)
+    
+    async def _visit_site_async(self, session, semaphore, page_no, site_url):
+        if self._stop.is_set():
+            return
+        
+        # Check if we're paused
+        while self._paused.is_set() and not self._stop.is_set():
+            await asyncio.sleep(0.5)
             
-            # Guess name & niche
-            item.name = DataExtractor.guess_name(soup)
-            item.niche = DataExtractor.guess_niche(soup)
+        if self._stop.is_set():
+            return
             
-            # socials
-            insta, socials = DataExtractor.extract_socials(html)
-            item.instagram = insta
-            if socials:
-                # remove instagram from "other"
-                other = {k: v for k, v in socials.items() if k != "Instagram"}
-                item.social = ", ".join([f"{k}: {v}" for k, v in other.items()]) if other else ""
-                
-            # WhatsApp - use N/A if not found
-            whatsapp = DataExtractor.extract_whatsapp(html)
-            item.whatsapp = whatsapp if whatsapp else "N/A"
+        self.signals.progress.emit(f"Scanning: {site_url}")
+        html = await async_fetch.fetch_text(session, site_url, semaphore, timeout=15, max_bytes=MAX_PAGE_BYTES)
+        item = await self._process_html_async(page_no, site_url, html)
+        if item and not self._stop.is_set():
+            self.signals.row_found.emit(item)
+    
+    async def _visit_sites_async(self, links, max_workers, session=None):
+        if session is None:
+            async with async_fetch.create_session(headers=random_header()) as session:
+                return await self._visit_sites_async(links, max_workers, session)
+        
+        # One session and one event loop multiplex every site visit
+        semaphore = asyncio.Semaphore(max_workers)
+        await asyncio.gather(*(
+            self._visit_site_async(session, semaphore, page_no, site_url)
+            for page_no, site_url in links
+        ))
+    
+    async def _fetch_serp_page_async(self, session, semaphore, qtext, page_idx):
+        if self._stop.is_set():
+            return []
+        
+        # Check if we're paused
+        while self._paused.is_set() and not self._stop.is_set():
+            await asyncio.sleep(0.5)
             
-            # Extract address
-            item.address = DataExtractor.extract_address(html)
+        if self._stop.is_set():
+            return []
+        
+        links = self._cached_serp_links(qtext, page_idx)
+        if links is not None:
+            return list(links)
+        
+        async with self._serp_bucket:
+            html = await async_fetch.fetch_text(session, google_serp_page_url(qtext, page_idx), semaphore, timeout=20)
+        if not html:
+            return []  # Failed pages are not cached
+        links = parse_serp_links(html)
+        self._cache_serp_links(qtext, page_idx, links)
+        return links
+    
+    async def _run_async(self, queries, pages, max_workers):
+        # SERP pages feed site visits through a queue on one session, so visits
+        # start as soon as the first page is parsed instead of after every query
+        async with async_fetch.create_session(headers=random_header()) as session:
+            visits: asyncio.Queue = asyncio.Queue()
+            seen: Set[str] = set()  # Only touched on the event loop, so no lock
+            serp_semaphore = asyncio.Semaphore(3)  # Same width as the threaded SERP fetch
+            site_semaphore = asyncio.Semaphore(max_workers)
+            self._start_parse_pool()
             
-            # If ecommerce_only is on with a chosen platform, drop non-matching platforms
-            if self.params["ecommerce_only"] and self.params["platform"] != "Any":
-                chosen = self.params["platform"]
-                if chosen in ECOM_PLATFORM_QUERIES:
-                    if item.platform and item.platform != chosen:
-                        return None
+            async def enqueue_page(qtext, page_idx):
+                links = await self._fetch_serp_page_async(session, serp_semaphore, qtext, page_idx)
+                new_links: List[Tuple[int, str]] = []
+                add_unique_links(page_idx + 1, links, seen, new_links)
+                with self._lock:
+                    self._total_count += len(new_links)
+                for link in new_links:
+                    visits.put_nowait(link)
             
-            with self._lock:
-                self._processed_count += 1
-                self.signals.update_progress.emit(self._processed_count, self._total_count)
-                
-            return item
-        except Exception as e:
-            with self._lock:
-                self._processed_count += 1
-                self.signals.update_progress.emit(self._processed_count, self._total_count)
+            async def produce():
+                try:
+                    for qtext in queries:
+                        if self._stop.is_set():
+                            return
+                        self.signals.progress.emit(f"Fetching SERPs: {qtext}")
+                        await asyncio.gather(*(enqueue_page(qtext, page_idx) for page_idx in range(pages)))
+                    # Visits are already under way; the total is known once every SERP page is in
+                    self.signals.progress.emit(f"Visiting {len(seen)} result pages...")
+                finally:
+                    for _ in range(max_workers):
+                        visits.put_nowait(None)  # One stop marker per visitor
+            
+            async def visit():
+                while True:
+                    link = await visits.get()
+                    if link is None:
+                        return
+                    await self._visit_site_async(session, site_semaphore, *link)
+            
+            await asyncio.gather(produce(), *(visit() for _ in range(max_workers)))
+    
+    def _parse_args(self, page_no, site_url, html):
+        return (html, site_url, page_no, self.params["location"],
+                bool(self.params["ecommerce_only"]), self.params["platform"])
+    
+    def _count_processed(self):
+        with self._lock:
+            self._processed_count += 1
+            self.signals.update_progress.emit(self._processed_count, self._total_count)
+    
+    def _process_html(self, page_no, site_url, html):
+        if not html:
             return None
+        try:
+            item = self._parse_pool.submit(parse_site_html, *self._parse_args(page_no, site_url, html)).result()
+        except Exception:
+            item = None
+        self._count_processed()
+        return item
+    
+    async def _process_html_async(self, page_no, site_url, html):
+        if not html:
+            return None
+        loop = asyncio.get_running_loop()
+        try:
+            item = await loop.run_in_executor(self._parse_pool, parse_site_html, *self._parse_args(page_no, site_url, html))
+        except Exception:
+            item = None
+        self._count_processed()
+        return item
             
-    def _sleep(self, adaptive=False):
-        if adaptive:
-            # Adaptive delay based on response times
-            dmin = self.params.get("delay_min", 0.5)  # Reduced minimum
-            dmax = self.params.get("delay_max", 1.5)  # Reduced maximum
-        else:
-            dmin = self.params.get("delay_min", 1.0)
-            dmax = self.params.get("delay_max", 2.5)
-        time.sleep(random.uniform(dmin, dmax))
-        
     def run(self):
         try:
             self._run_logic()
@@ -138,6 +240,10 @@ class WebScrapeWorker(QRunnable):
                 self.signals.finished_ok.emit()
         except Exception as e:
             self.signals.finished_err.emit(str(e))
+        finally:
+            self._session.close()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(wait=False)
             
     def _run_logic(self):
         q = self.params["query"].strip()
@@ -151,7 +257,13 @@ class WebScrapeWorker(QRunnable):
         max_workers = int(self.params.get("max_workers", 5))  # New parameter
         
         queries = build_google_queries(q, loc, niche, ecommerce_only, platform)
-        all_links: List[Tuple[int, str]] = []
+        # Links are deduplicated as they arrive, keeping the first page each was seen on
+        seen: Set[str] = set()
+        uniq_links: List[Tuple[int, str]] = []
+        
+        if not use_browser and async_fetch.AIOHTTP_AVAILABLE:
+            asyncio.run(self._run_async(queries, pages, max_workers))
+            return
         
         if use_browser:
             self.signals.progress.emit("Launching browser...")
@@ -173,14 +285,10 @@ class WebScrapeWorker(QRunnable):
                     box.send_keys(Keys.ENTER)
                     links = selenium_collect_serp_links(driver, pages)
                     for i, link in enumerate(links):
-                        all_links.append((i // 10 + 1, link))  # approx page no
+                        add_unique_links(i // 10 + 1, [link], seen, uniq_links)  # approx page no
             finally:
                 driver.quit()
         else:
-            # Use a session for connection pooling
-            session = requests.Session()
-            session.headers.update(random_header())
-            
             for qtext in queries:
                 if self._stop.is_set(): 
                     return
@@ -189,7 +297,7 @@ class WebScrapeWorker(QRunnable):
                 # Fetch multiple SERP pages concurrently
                 with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
                     future_to_page = {
-                        executor.submit(self._fetch_serp_page, session, qtext, page_idx): page_idx 
+                        executor.submit(self._fetch_serp_page, qtext, page_idx): page_idx 
                         for page_idx in range(pages)
                     }
                     
@@ -201,22 +309,15 @@ class WebScrapeWorker(QRunnable):
                         page_idx = future_to_page[future]
                         try:
                             links = future.result()
-                            for link in links:
-                                all_links.append((page_idx + 1, link))
-                            self._sleep(adaptive=True)
+                            add_unique_links(page_idx + 1, links, seen, uniq_links)
                         except Exception as e:
                             self.signals.progress.emit(f"SERP fetch failed (page {page_idx+1}): {str(e)}")
         
-        # Deduplicate links
-        seen = set()
-        uniq_links: List[Tuple[int, str]] = []
-        for p, u in all_links:
-            if u not in seen:
-                seen.add(u)
-                uniq_links.append((p, u))
+        self._prepare_visits(uniq_links)
         
-        self._total_count = len(uniq_links)
-        self.signals.progress.emit(f"Visiting {len(uniq_links)} result pages...")
+        if async_fetch.AIOHTTP_AVAILABLE:
+            asyncio.run(self._visit_sites_async(uniq_links, max_workers))
+            return
         
         # Process sites concurrently with a thread pool
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -238,7 +339,16 @@ class WebScrapeWorker(QRunnable):
                 except Exception as e:
                     self.signals.progress.emit(f"Error processing {site_url}: {str(e)}")
     
-    def _fetch_serp_page(self, session, qtext, page_idx):
+    def _prepare_visits(self, uniq_links):
+        self._total_count = len(uniq_links)
+        self.signals.progress.emit(f"Visiting {len(uniq_links)} result pages...")
+        self._start_parse_pool()
+        return uniq_links
+    
+    def _start_parse_pool(self):
+        self._parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count())
+    
+    def _fetch_serp_page(self, qtext, page_idx):
         if self._stop.is_set():
             return []
             
@@ -249,19 +359,30 @@ class WebScrapeWorker(QRunnable):
         if self._stop.is_set():
             return []
             
-        url = google_serp_page_url(qtext, page_idx)
+        links = self._cached_serp_links(qtext, page_idx)
+        if links is not None:
+            return list(links)
+        
         try:
-            r = session.get(url, timeout=20)
-            if r.status_code == 200 and r.text:
-                return parse_serp_links(r.text)
-            return []
+            with self._serp_bucket:
+                r = self._session.get(google_serp_page_url(qtext, page_idx), timeout=20)
+            r.raise_for_status()
+            links = parse_serp_links(r.text)
         except Exception:
-            return []
+            return []  # Failed pages are not cached
+        self._cache_serp_links(qtext, page_idx, links)
+        return links
+
+def add_unique_links(page_no: int, links: List[str], seen: Set[str], uniq_links: List[Tuple[int, str]]) -> None:
+    """Append (page_no, link) for each link not already in seen."""
+    for link in links:
+        if link not in seen:
+            seen.add(link)
+            uniq_links.append((page_no, link))
 
 def random_header() -> Dict[str, str]:
-    """Return a random user agent header."""
-    from config import DEFAULT_HEADERS
-    return {"User-Agent": random.choice(DEFAULT_HEADERS), "Accept-Language": "en-US,en;q=0.9"}
+    """Return a random user agent header. The dict is shared, so do not mutate it."""
+    return random.choice(_HEADER_POOL)
 
 def is_valid_result_link(href: str) -> bool:
     """Check if a URL is a valid result link."""
@@ -291,23 +412,80 @@ def build_google_queries(query: str, location: str, niche: str, ecommerce_only:
     plat_bits = " ".join(ECOM_PLATFORM_QUERIES[platform])
     return [f'{base} {plat_bits}']
 
-def fetch_url(url: str, timeout: int = 15) -> Optional[str]:
-    """Fetch URL content with timeout."""
+def fetch_url(url: str, timeout: int = 15, session: Optional[requests.Session] = None,
+              max_bytes: int = MAX_PAGE_BYTES) -> Optional[str]:
+    """Fetch URL content with timeout over a keep-alive session (the shared one by default).
+    
+    The body is streamed: non-HTML or oversized pages are dropped from their
+    headers, and at most max_bytes are read.
+    """
     try:
-        r = requests.get(url, headers=random_header(), timeout=timeout)
-        if r.status_code == 200 and r.text:
-            return r.text
-        return None
+        with (session or _SESSION).get(url, headers=random_header(), timeout=timeout, stream=True) as r:
+            if r.status_code != 200 or not async_fetch.is_small_html(r.headers, max_bytes):
+                return None
+            r.raw.decode_content = True
+            body = r.raw.read(max_bytes)
+            return body.decode(r.encoding or 'utf-8', errors='replace') or None
     except Exception:
         return None
 
+def parse_site_html(html: str, site_url: str, page_no: int, location: str,
+                    ecommerce_only: bool, platform: str) -> Optional[ScrapedItem]:
+    """Build a ScrapedItem from a site's HTML, or None if it has no email or wrong platform.
+    
+    Kept at module level so it can be pickled into a process pool.
+    """
+    # First check if we can extract an email - if not, skip this site
+    emails = DataExtractor.extract_emails(html)
+    if not emails:
+        return None
+    
+    # Detect platform & e-commerce hints
+    detected = DataExtractor.detect_platform(html)
+    
+    # If ecommerce_only is on with a chosen platform, drop non-matching platforms before parsing
+    if ecommerce_only and platform != "Any":
+        if platform in ECOM_PLATFORM_QUERIES:
+            if detected and detected != platform:
+                return None
+    
+    bundle = DataExtractor.extract_all(html, HtmlDocument(html))
+    item = ScrapedItem()
+    item.website = site_url
+    item.location = location
+    item.source_page = page_no
+    
+    # Add email (first one found)
+    item.email = emails[0]
+    item.platform = detected
+    
+    # Guess name & niche
+    item.name = bundle['name']
+    item.niche = bundle['niche']
+    
+    # socials
+    item.instagram = bundle['instagram']
+    socials = bundle['socials']
+    if socials:
+        # remove instagram from "other"
+        other = {k: v for k, v in socials.items() if k != "Instagram"}
+        item.social = ", ".join([f"{k}: {v}" for k, v in other.items()]) if other else ""
+        
+    # WhatsApp - use N/A if not found
+    item.whatsapp = bundle['whatsapp'] or "N/A"
+    
+    item.address = bundle['address']
+    return item
+
+# Result links on a SERP, as CSS for selectolax and the same query as XPath for lxml
+SERP_LINK_SELECTOR = "#search a[href], a[jsname][href]"
+SERP_LINK_XPATH = '//*[@id="search"]//a[@href] | //a[@jsname][@href]'
+
 def parse_serp_links(html: str) -> List[str]:
     """Parse SERP links from HTML."""
-    soup = BeautifulSoup(html, "lxml")
     results: List[str] = []
     # Try robust selectors
-    for a in soup.select("#search a[href], a[jsname][href]"):
-        href = a.get("href", "")
+    for href in page_link_hrefs(html, SERP_LINK_SELECTOR, SERP_LINK_XPATH):
         if is_valid_result_link(href) and is_landing_page(href):
             results.append(href)
     # Deduplicate, preserve order
@@ -332,8 +510,7 @@ def selenium_collect_serp_links(driver, pages: int) -> List[str]:
     links: List[str] = []
     for page in range(pages):
         time.sleep(random.uniform(1.2, 2.8))  # human-like pause
-        soup = BeautifulSoup(driver.page_source, "lxml")
-        page_links = parse_serp_links(str(soup))
+        page_links = parse_serp_links(driver.page_source)
         for u in page_links:
             if u not in links:
                 links.append(u)
@@ -1,8 +1,22 @@
 """Data models used throughout the application."""
 
-from dataclasses import dataclass, field
+import sys
+from array import array
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Tuple, Set
 
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__, as dataclass(slots=True) does on Python 3.10+.
+    
+    Slotted instances carry no per-instance __dict__, which adds up over
+    thousands of scraped records.
+    """
+    names = tuple(f.name for f in fields(cls))
+    body = {k: v for k, v in cls.__dict__.items() if k not in names + ('__dict__', '__weakref__')}
+    body['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, body)
+
+@_slotted
 @dataclass
 class ScrapedItem:
     """Represents a scraped data item from a website."""
@@ -17,7 +31,12 @@ class ScrapedItem:
     location: str = ""
     address: str = ""
     source_page: int = 0
+    
+    def as_tuple(self) -> Tuple:
+        """Return field values in declaration order, for DataFrame.from_records."""
+        return tuple(getattr(self, name) for name in SCRAPED_ITEM_FIELDS)
 
+@_slotted
 @dataclass
 class BusinessData:
     """Represents complete business data collected from various sources."""
@@ -33,4 +52,49 @@ class BusinessData:
     hours: str = ""
     products_services: str = ""
     image_path: str = ""
-    search_query: str = ""
\ No newline at end of file
+    search_query: str = ""
+    
+    def __post_init__(self):
+        for name in BUSINESS_DATA_SHARED_FIELDS:
+            setattr(self, name, sys.intern(getattr(self, name)))
+    
+    def as_tuple(self) -> Tuple:
+        """Return field values in declaration order, for DataFrame.from_records."""
+        return tuple(getattr(self, name) for name in BUSINESS_DATA_FIELDS)
+
+# Field names in declaration order, matching as_tuple()
+SCRAPED_ITEM_FIELDS = tuple(f.name for f in fields(ScrapedItem))
+BUSINESS_DATA_FIELDS = tuple(f.name for f in fields(BusinessData))
+
+# Low-cardinality fields repeated across most records of a run; these are
+# interned so every record shares one string object per distinct value
+SCRAPED_ITEM_SHARED_FIELDS = ('platform', 'niche', 'location')
+BUSINESS_DATA_SHARED_FIELDS = ('country', 'state', 'location', 'search_query')
+
+class ScrapedTable:
+    """Column-wise store of ScrapedItems: one list per field instead of one object per row.
+    
+    Exports hand the columns straight to pandas without walking every item.
+    source_page is packed into a C int array, 4 bytes per row rather than an int object.
+    """
+    
+    def __init__(self):
+        self.columns: Dict[str, List] = {name: [] for name in SCRAPED_ITEM_FIELDS}
+        self.columns['source_page'] = array('i')
+    
+    def append(self, item: ScrapedItem):
+        # Items arrive unpickled from the parse pool, so interning happens here
+        for name, column in self.columns.items():
+            value = getattr(item, name)
+            column.append(sys.intern(value) if name in SCRAPED_ITEM_SHARED_FIELDS else value)
+    
+    def __len__(self) -> int:
+        return len(self.columns['email'])
+    
+    def source_page(self, index: int) -> int:
+        """Search results page the row at index was found on."""
+        return self.columns['source_page'][index]
+    
+    def renamed(self, headers: List[str]) -> Dict[str, List]:
+        """Columns keyed by headers, given in field order, e.g. for pandas.DataFrame."""
+        return dict(zip(headers, self.columns.values()))
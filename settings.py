@@ -1,7 +1,24 @@
 """Application settings management."""
 
-import json
 import os
+import types
+
+from utils import json_io
+
+# Resolved once; expanduser looks up the home directory on every call
+SETTINGS_FILE = os.path.join(os.path.expanduser('~'), 'data_collector_settings.json')
+
+def write_settings_file(path, data):
+    """Write serialized settings bytes to path atomically.
+    
+    The bytes go to a file beside the target, which is then renamed over it,
+    so a crash mid-write leaves the previous file intact instead of a
+    truncated one. Raises OSError on failure.
+    """
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb', buffering=4096) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
 
 class SettingsManager:
     """Manages application settings persistence and retrieval."""
@@ -25,28 +42,73 @@ class SettingsManager:
         'web_scraping_workers': 5
     }
     
+    # Serialized once at import; parsing it yields a fresh, fully independent copy of the defaults
+    _DEFAULT_JSON = json_io.dumps(DEFAULT_SETTINGS)
+    
+    # Parsed settings files keyed by (path, mtime_ns), so unchanged files are not re-read
+    _cache = {}
+    
     def __init__(self):
-        self.settings_file = os.path.join(os.path.expanduser('~'), 'data_collector_settings.json')
-        self.settings = self.DEFAULT_SETTINGS.copy()
-        self.load_settings()
+        self.settings_file = SETTINGS_FILE
+        self._last_saved_json = None  # What the file is known to hold, as serialized bytes
+        self._view = None  # Attribute view of settings, rebuilt after a change
+        
+        # Defaults and saved values are merged in a single dict build
+        loaded = self.read_settings_file()
+        if loaded is None:
+            self.settings = json_io.loads(self._DEFAULT_JSON)  # No settings saved yet
+        else:
+            self.settings = {**self.DEFAULT_SETTINGS, **loaded}
+            self._last_saved_json = json_io.dumps(self.settings)
+    
+    def read_settings_file(self):
+        """Return the saved settings, reusing the last parse if the file is unchanged, or None."""
+        try:
+            key = (self.settings_file, os.stat(self.settings_file).st_mtime_ns)
+        except OSError:
+            return None
+        
+        try:
+            if key not in self._cache:
+                with open(self.settings_file, 'rb') as f:
+                    self._cache[key] = json_io.loads(f.read())
+            return self._cache[key]
+        except Exception as e:
+            print(f"Error loading settings: {e}")
+            return None
     
     def load_settings(self):
-        """Load settings from file."""
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, 'r') as f:
-                    self.settings.update(json.load(f))
-            except Exception as e:
-                print(f"Error loading settings: {e}")
+        """Reload settings from file over the current ones."""
+        loaded = self.read_settings_file()
+        if loaded is not None:
+            self.settings.update(loaded)
+            self._view = None
+            self._last_saved_json = json_io.dumps(self.settings)
     
     def save_settings(self):
-        """Save settings to file."""
+        """Save settings to file, priming the load cache with what was written.
+        
+        Nothing is written when the settings serialize to what the file already holds.
+        """
+        data = json_io.dumps(self.settings)
+        if data == self._last_saved_json:
+            return
+        for key in [key for key in self._cache if key[0] == self.settings_file]:
+            del self._cache[key]
         try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f)
+            write_settings_file(self.settings_file, data)
+            self._last_saved_json = data
+            self._cache[(self.settings_file, os.stat(self.settings_file).st_mtime_ns)] = dict(self.settings)
         except Exception as e:
             print(f"Error saving settings: {e}")
     
+    @property
+    def view(self):
+        """Settings as attributes, e.g. manager.view.theme, for repeated reads."""
+        if self._view is None:
+            self._view = types.SimpleNamespace(**self.settings)
+        return self._view
+    
     def get(self, key, default=None):
         """Get a setting value."""
         return self.settings.get(key, default)
@@ -54,7 +116,9 @@ class SettingsManager:
     def set(self, key, value):
         """Set a setting value."""
         self.settings[key] = value
+        self._view = None
     
     def update(self, new_settings):
         """Update multiple settings."""
-        self.settings.update(new_settings)
\ No newline at end of file
+        self.settings.update(new_settings)
+        self._view = None
\ No newline at end of file
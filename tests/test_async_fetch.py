@@ -0,0 +1,30 @@
+"""Tests for core.async_fetch."""
+
+import asyncio
+import unittest
+
+from core.async_fetch import read_capped
+
+class ChunkedStream:
+    """Stand-in for aiohttp's StreamReader, handing out one chunk per readany()."""
+    
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+    
+    async def readany(self):
+        return self.chunks.pop(0) if self.chunks else b''
+
+class ReadCappedTest(unittest.TestCase):
+    def test_reads_every_chunk_until_eof(self):
+        chunks = [b'<html>', b'x' * 8000, b'<footer>info@example.com</footer></html>']
+        body = asyncio.run(read_capped(ChunkedStream(chunks), 512 * 1024))
+        self.assertEqual(body, b''.join(chunks))
+    
+    def test_stops_at_max_bytes(self):
+        stream = ChunkedStream([b'a' * 6, b'b' * 6, b'c' * 6])
+        body = asyncio.run(read_capped(stream, 10))
+        self.assertEqual(body, b'a' * 6 + b'b' * 4)
+        self.assertEqual(stream.chunks, [b'c' * 6])  # Nothing read past the cap
+
+if __name__ == '__main__':
+    unittest.main()
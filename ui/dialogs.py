@@ -1,13 +1,33 @@
 """Dialog windows for the application."""
 
 import os
+from operator import attrgetter
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
                             QPushButton, QGroupBox, QFormLayout, QSpinBox, QCheckBox, 
                             QRadioButton, QButtonGroup, QScrollArea, QDialogButtonBox, 
-                            QMessageBox, QFileDialog)
-from PyQt5.QtCore import Qt
+                            QFileDialog)
+from PyQt5.QtCore import Qt, QTimer
 from config import THEMES
 
+# (settings key, bound getter of the widget holding it), read in one C call per entry
+_EXPORT_SPEC = (
+    ('api_key', attrgetter('api_key_input.text')),
+    ('use_proxy', attrgetter('use_proxy_checkbox.isChecked')),
+    ('proxy_file', attrgetter('proxy_file_input.text')),
+    ('use_tor', attrgetter('use_tor_checkbox.isChecked')),
+    ('thread_count', attrgetter('thread_count.value')),
+    ('batch_size', attrgetter('batch_size.value')),
+    ('skip_missing_social', attrgetter('skip_missing_social_checkbox.isChecked')),
+    ('requests_per_minute', attrgetter('requests_per_minute.value')),
+    ('random_delay_min', attrgetter('random_delay_min.value')),
+    ('random_delay_max', attrgetter('random_delay_max.value')),
+    ('validate_phone', attrgetter('validate_phone_checkbox.isChecked')),
+    ('validate_email', attrgetter('validate_email_checkbox.isChecked')),
+    ('validate_website', attrgetter('validate_website_checkbox.isChecked')),
+    ('enable_web_scraping', attrgetter('enable_web_scraping_checkbox.isChecked')),
+    ('web_scraping_workers', attrgetter('web_scraping_workers.value')),
+)
+
 class SettingsDialog(QDialog):
     """Settings dialog for configuring application options."""
     
@@ -189,6 +209,14 @@ class SettingsDialog(QDialog):
         # Add the scroll area to the main layout
         main_layout.addWidget(scroll_area)
         
+        # Non-blocking confirmation shown above the buttons, cleared after two seconds
+        self.status_label = QLabel("")
+        main_layout.addWidget(self.status_label)
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(2000)
+        self.status_timer.timeout.connect(self.status_label.clear)
+        
         # Buttons - now with Apply button
         buttons = QDialogButtonBox(QDialogButtonBox.Apply | QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         buttons.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
@@ -198,14 +226,16 @@ class SettingsDialog(QDialog):
         
         # Store reference to parent for applying settings
         self.parent = parent
+        self.proxy_dialog = None  # Created on first Browse click
     
     def browse_proxy_file(self):
-        """Browse for proxy file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Proxy List File", "", "Text Files (*.txt);;All Files (*)"
-        )
-        if file_path:
-            self.proxy_file_input.setText(file_path)
+        """Browse for proxy file, reusing one dialog across clicks."""
+        if self.proxy_dialog is None:
+            self.proxy_dialog = QFileDialog(self, "Select Proxy List File")
+            self.proxy_dialog.setNameFilter("Text Files (*.txt);;All Files (*)")
+            self.proxy_dialog.setFileMode(QFileDialog.ExistingFile)
+        if self.proxy_dialog.exec_():
+            self.proxy_file_input.setText(self.proxy_dialog.selectedFiles()[0])
     
     def get_settings(self):
         """Get current settings values."""
@@ -216,25 +246,10 @@ class SettingsDialog(QDialog):
             theme = "Blue"
         elif self.green_theme_radio.isChecked():
             theme = "Green"
-            
-        return {
-            'api_key': self.api_key_input.text(),
-            'use_proxy': self.use_proxy_checkbox.isChecked(),
-            'proxy_file': self.proxy_file_input.text(),
-            'use_tor': self.use_tor_checkbox.isChecked(),
-            'theme': theme,
-            'thread_count': self.thread_count.value(),
-            'batch_size': self.batch_size.value(),
-            'skip_missing_social': self.skip_missing_social_checkbox.isChecked(),
-            'requests_per_minute': self.requests_per_minute.value(),
-            'random_delay_min': self.random_delay_min.value(),
-            'random_delay_max': self.random_delay_max.value(),
-            'validate_phone': self.validate_phone_checkbox.isChecked(),
-            'validate_email': self.validate_email_checkbox.isChecked(),
-            'validate_website': self.validate_website_checkbox.isChecked(),
-            'enable_web_scraping': self.enable_web_scraping_checkbox.isChecked(),
-            'web_scraping_workers': self.web_scraping_workers.value()
-        }
+        
+        settings = {key: getter(self)() for key, getter in _EXPORT_SPEC}
+        settings['theme'] = theme
+        return settings
     
     def set_theme(self, theme):
         """Set the theme radio button."""
@@ -252,16 +267,26 @@ class SettingsDialog(QDialog):
         if self.parent:
             # Get the current settings
             new_settings = self.get_settings()
+            if new_settings == self.parent.settings:
+                return  # Nothing changed, so no re-theme, write or confirmation
             
-            # Apply theme immediately if changed
+            # Re-theme and confirm with painting held off, so the window repaints once
             current_theme = self.parent.settings.get('theme', 'Light')
             new_theme = new_settings.get('theme', 'Light')
-            if current_theme != new_theme:
-                self.parent.apply_theme(new_theme)
-            
-            # Update parent settings
-            self.parent.settings = new_settings
-            self.parent.save_settings()
+            self.parent.setUpdatesEnabled(False)
+            try:
+                if current_theme != new_theme:
+                    self.parent.apply_theme(new_theme)
+                
+                # Update parent settings
+                self.parent.settings = new_settings
+                
+                # Confirm inside the dialog rather than with a blocking message box
+                self.status_label.setText("Settings applied.")
+                self.status_timer.start()
+            finally:
+                self.parent.setUpdatesEnabled(True)
+                self.parent.update()
             
-            # Show confirmation message
-            QMessageBox.information(self, "Settings Applied", "Settings have been applied successfully.")
\ No newline at end of file
+            # Write to disk only after the repaint has been queued
+            self.parent.save_settings()
\ No newline at end of file
@@ -1,21 +1,11 @@
 # ui/main_window.py
 import os
-import sys
 import re
-import time
-import random
-import csv
-import threading
-import json
+import sys
 import datetime
 import shutil
 import atexit
-import uuid
-import socket
-import phonenumbers
-import requests
-import pandas as pd
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, QSize, QTimer, QRunnable, QThreadPool
 from PyQt5.QtGui import QIcon, QPixmap, QFont, QColor
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
@@ -33,14 +23,95 @@ from ui.widgets import (
     SearchParametersCard, NetworkStatusCard, WebScrapingCard, 
     ResultsCard, LogsCard, SettingsDialog
 )
-from core.data_collection import DataCollectorThread
-from core.web_scraping import WebScrapeWorker
+from utils import json_io
+from models import ScrapedTable
+from settings import SETTINGS_FILE, write_settings_file
+# core.data_collection (Selenium), core.web_scraping (bs4/aiohttp), pandas and
+# phonenumbers are imported where first used to keep startup fast
 from core.utils import (
     InternetConnectionChecker, ProxyManager, EmailExtractor, 
     THEMES, NIGERIAN_STATES
 )
 from core.models import ResultsModel, LogModel
 
+# Patterns used per row while collecting, validating and exporting
+_RE_PHONE_JUNK = re.compile(r'[^\d+]')
+_RE_VALID_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_RE_UNSAFE_FILENAME = re.compile(r'[^\w\s-]')
+
+# Fields clean_data_entry passes through stripped, and those among them worth interning
+_URL_PREFIXES = ('http://', 'https://')
+_OTHER_FIELDS = ('country', 'state', 'location', 'hours', 'products_services', 'image_path')
+_INTERNED_FIELDS = frozenset(('country', 'state', 'location'))
+
+# Every key clean_data_entry sets, in output order; copying this presized dict
+# and overwriting its values avoids growing a fresh dict key by key per row
+_CLEANED_TEMPLATE = dict.fromkeys(
+    ('name', 'phone', 'email', 'website', 'instagram', 'address') + _OTHER_FIELDS, 'N/A')
+
+def _dup_key(first, second):
+    """Integer key for a pair of normalized strings.
+    
+    Duplicate sets hold these ints instead of string tuples; a 64-bit hash
+    collision between distinct entries in one run is vanishingly unlikely.
+    """
+    return hash((first, second))
+
+def _entry_key(entry):
+    """Duplicate-detection key of a cleaned entry, from its lowercased name and address.
+    
+    Cleaning already strips both, so they are not stripped again here.
+    """
+    return _dup_key(entry.get('name', '').lower(), entry.get('address', '').lower())
+
+# CSV headers for web scraping results, in ScrapedItem field order
+WEB_CSV_HEADERS = [
+    'Email', 'Business Name', 'Website', 'Platform', 'Niche/Category', 'Instagram',
+    'Other Socials', 'WhatsApp', 'Location', 'Address', 'Source Page'
+]
+
+class SettingsWriterSignals(QObject):
+    """Signals for SettingsWriter; a QRunnable cannot emit signals itself."""
+    saved = pyqtSignal(bytes)
+    failed = pyqtSignal(bytes, str)
+
+class SettingsWriter(QRunnable):
+    """Writes serialized settings to disk off the GUI thread, replacing the file atomically."""
+    
+    def __init__(self, path, data, signals):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.signals = signals
+    
+    def run(self):
+        try:
+            write_settings_file(self.path, self.data)
+        except Exception as e:
+            self.signals.failed.emit(self.data, str(e))
+        else:
+            self.signals.saved.emit(self.data)
+
+class CleanWorkerSignals(QObject):
+    """Signals for CleanWorker; a QRunnable cannot emit signals itself."""
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+class CleanWorker(QRunnable):
+    """Cleans and de-duplicates a snapshot of collected entries off the GUI thread."""
+    
+    def __init__(self, entries):
+        super().__init__()
+        self.entries = entries
+        self.signals = CleanWorkerSignals()
+    
+    def run(self):
+        from core.data_processor import DataProcessor
+        try:
+            self.signals.finished.emit(DataProcessor.clean_data(self.entries))
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
 class DataCollectionApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -49,8 +120,8 @@ class DataCollectionApp(QMainWindow):
         
         # Initialize data storage
         self.collected_data = []
-        self.unique_entries = set()  # Track unique entries to avoid duplicates
-        self.web_scraped_data = []  # Store web scraped data
+        self.unique_entries = set()  # Keys of entries seen so far, to avoid duplicates
+        self.web_scraped_data = ScrapedTable()  # Store web scraped data
         self.web_unique_entries = set()  # Track unique web scraped entries
         self.current_directory = ""
         self.settings = {
@@ -73,11 +144,30 @@ class DataCollectionApp(QMainWindow):
         }
         
         # Load settings if available
+        self.saved_settings_json = None  # Serialized settings as last read from or written to disk
+        self.pending_settings_json = None  # Serialized settings queued for writing
+        self.theme_styles = {}  # Theme name -> built style sheet
+        # One writer thread, so queued saves reach the disk in order
+        self.settings_pool = QThreadPool(self)
+        self.settings_pool.setMaxThreadCount(1)
+        # Shared by every writer and owned here, so results arrive after a writer is gone
+        self.settings_writer_signals = SettingsWriterSignals(self)
+        self.settings_writer_signals.saved.connect(self.settings_saved)
+        self.settings_writer_signals.failed.connect(self.settings_save_failed)
         self.load_settings()
         
         # Setup UI
         self.setup_ui()
         
+        # Rows waiting to be inserted into the results table; flushed at 10 Hz
+        # so a burst of results costs one insert and repaint instead of many
+        self.pending_rows = []
+        self.pending_duplicates = []  # Names of skipped duplicates, logged once per flush
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(100)
+        self.flush_timer.timeout.connect(self.flush_pending_rows)
+        
         # Setup status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
@@ -106,6 +196,9 @@ class DataCollectionApp(QMainWindow):
     def cleanup(self):
         """Clean up temporary files and stop threads"""
         try:
+            # Let a queued settings write finish
+            self.settings_pool.waitForDone()
+            
             temp_dir = os.path.join(os.path.expanduser('~'), 'temp_data_collector')
             if os.path.exists(temp_dir):
                 shutil.rmtree(temp_dir)
@@ -117,31 +210,48 @@ class DataCollectionApp(QMainWindow):
             # Stop connection checker
             if hasattr(self, 'connection_checker'):
                 self.connection_checker.stop()
-                self.connection_checker.wait()
         except:
             pass
     
     def load_settings(self):
         """Load settings from file"""
-        settings_file = os.path.join(os.path.expanduser('~'), 'data_collector_settings.json')
-        if os.path.exists(settings_file):
+        if os.path.exists(SETTINGS_FILE):
             try:
-                with open(settings_file, 'r') as f:
-                    self.settings = json.load(f)
+                with open(SETTINGS_FILE, 'rb') as f:
+                    self.settings = json_io.loads(f.read())
+                self.saved_settings_json = json_io.dumps(self.settings)
             except:
                 pass
     
     def save_settings(self):
-        """Save settings to file"""
-        settings_file = os.path.join(os.path.expanduser('~'), 'data_collector_settings.json')
-        try:
-            with open(settings_file, 'w') as f:
-                json.dump(self.settings, f)
-        except:
-            pass
+        """Save settings to file, skipping the write if nothing changed since the last load, save or queued save"""
+        data = json_io.dumps(self.settings)
+        if data == self.saved_settings_json or data == self.pending_settings_json:
+            return
+        self.pending_settings_json = data
+        self.settings_pool.start(SettingsWriter(SETTINGS_FILE, data, self.settings_writer_signals))
+    
+    def settings_saved(self, data):
+        """Record settings as saved once the writer has put them on disk"""
+        self.saved_settings_json = data
+        if data == self.pending_settings_json:
+            self.pending_settings_json = None
+    
+    def settings_save_failed(self, data, message):
+        """Log a failed settings write; the next save retries it"""
+        if data == self.pending_settings_json:
+            self.pending_settings_json = None
+        self.log_message(f"Error saving settings: {message}")
     
     def apply_theme(self, theme_name):
         """Apply the selected theme to the application"""
+        style = self.theme_styles.get(theme_name)
+        if style is None:
+            style = self.theme_styles[theme_name] = self.build_theme_style(theme_name)
+        self.setStyleSheet(style)
+    
+    def build_theme_style(self, theme_name):
+        """Build the application style sheet for a theme"""
         theme = THEMES.get(theme_name, THEMES["Light"])
         
         style = f"""
@@ -187,18 +297,18 @@ class DataCollectionApp(QMainWindow):
                 color: {theme["button_disabled_text"]};
             }}
             
-            QTableWidget {{
+            QTableView {{
                 gridline-color: {theme["table_grid"]};
                 background-color: {theme["table"]};
                 border: 1px solid {theme["table_border"]};
                 border-radius: 4px;
             }}
             
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 5px;
             }}
             
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: {theme["table_selected"]};
                 color: {theme["table_selected_text"]};
             }}
@@ -284,7 +394,7 @@ class DataCollectionApp(QMainWindow):
                 height: 18px;
             }}
             
-            QTextEdit {{
+            QTextEdit, QPlainTextEdit {{
                 border: 1px solid {theme["text_edit_border"]};
                 border-radius: 4px;
                 padding: 5px;
@@ -295,6 +405,14 @@ class DataCollectionApp(QMainWindow):
                 color: {theme["label"]};
             }}
             
+            QLabel[connection="connected"] {{
+                color: green;
+            }}
+            
+            QLabel[connection="disconnected"] {{
+                color: red;
+            }}
+            
             QRadioButton::indicator {{
                 width: 18px;
                 height: 18px;
@@ -324,20 +442,31 @@ class DataCollectionApp(QMainWindow):
             }}
         """
         
-        self.setStyleSheet(style)
+        return style
+    
+    def set_connection_state(self, state):
+        """Show the connection state on the network card's label.
+        
+        The color comes from the theme's QLabel[connection=...] rules; switching the
+        dynamic property re-polishes against the already parsed window style sheet,
+        where setStyleSheet would parse a new sheet on every change.
+        """
+        label = self.network_card.connection_label
+        if label.property("connection") == state:
+            return
+        label.setText("Connected" if state == "connected" else "Disconnected")
+        label.setProperty("connection", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
     
     def handle_connection_status_change(self, is_connected):
         """Handle changes in internet connection status"""
         if is_connected:
             self.status_bar.showMessage("Internet connection restored", 5000)
-            if hasattr(self, 'connection_label'):
-                self.connection_label.setText("Internet: Connected")
-                self.connection_label.setStyleSheet("color: green;")
+            self.set_connection_state("connected")
         else:
             self.status_bar.showMessage("Warning: Poor internet connection", 5000)
-            if hasattr(self, 'connection_label'):
-                self.connection_label.setText("Internet: Disconnected")
-                self.connection_label.setStyleSheet("color: red;")
+            self.set_connection_state("disconnected")
             
             # Notify collector thread about connection status
             if hasattr(self, 'collector_thread') and self.collector_thread:
@@ -388,9 +517,9 @@ class DataCollectionApp(QMainWindow):
         validate_action.triggered.connect(self.validate_data)
         edit_menu.addAction(validate_action)
         
-        clean_action = QAction("Clean Data", self)
-        clean_action.triggered.connect(self.clean_data)
-        edit_menu.addAction(clean_action)
+        self.clean_action = QAction("Clean Data", self)
+        self.clean_action.triggered.connect(self.clean_data)
+        edit_menu.addAction(self.clean_action)
         
         # View menu
         view_menu = menubar.addMenu("View")
@@ -538,8 +667,12 @@ class DataCollectionApp(QMainWindow):
         self.results_card = ResultsCard()
         results_layout.addWidget(self.results_card)
         
-        # Connect filter signal
-        self.results_card.filter_edit.textChanged.connect(self.filter_results)
+        # Connect filter signal; typing restarts the timer, so a burst of keystrokes filters once
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.filter_results)
+        self.results_card.filter_edit.textChanged.connect(lambda _text: self.filter_timer.start())
         
         return results_tab
     
@@ -649,18 +782,19 @@ class DataCollectionApp(QMainWindow):
                 return
         
         # Start collection thread
+        from core.data_collection import DataCollectorThread
         self.collector_thread = DataCollectorThread(
             search_query, location, state, country, num_entries, chromedriver_path, 
-            api_key, self.proxy_manager, self.search_card.skip_missing_social_checkbox.isChecked()
+            api_key, self.proxy_manager, self.search_card.skip_missing_social_checkbox.isChecked(),
+            self.search_card.collect_images_checkbox.isChecked()
         )
         self.collector_thread.progress_updated.connect(self.update_progress)
-        self.collector_thread.data_collected.connect(self.add_data_to_table)
+        self.collector_thread.data_batch_ready.connect(self.add_real_time_batch)
         self.collector_thread.status_updated.connect(self.update_status)
         self.collector_thread.finished.connect(self.collection_finished)
         self.collector_thread.error_occurred.connect(self.collection_error)
         self.collector_thread.proxy_rotated.connect(self.proxy_rotated)
         self.collector_thread.entry_skipped.connect(self.entry_skipped)
-        self.collector_thread.real_time_update.connect(self.add_real_time_data)
         self.collector_thread.connection_status_changed.connect(self.handle_connection_status_change)
         self.collector_thread.start()
     
@@ -683,19 +817,24 @@ class DataCollectionApp(QMainWindow):
     def entry_skipped(self, message):
         self.log_message(message)
     
+    def add_real_time_batch(self, rows):
+        """Add a batch of entries from the collector thread"""
+        for data in rows:
+            self.add_real_time_data(data)
+    
     def add_real_time_data(self, data):
         """Add data to table in real-time as it's retrieved"""
         # Clean the data before adding
         cleaned_data = self.clean_data_entry(data)
         
         # Create a unique key based on name and address to avoid duplicates
-        name = cleaned_data.get('name', '').strip().lower()
-        address = cleaned_data.get('address', '').strip().lower()
-        unique_key = (name, address)
+        unique_key = _entry_key(cleaned_data)
         
         # Skip if this is a duplicate entry
         if unique_key in self.unique_entries:
-            self.log_message(f"Duplicate entry skipped: {name}")
+            self.pending_duplicates.append(cleaned_data.get('name', '').strip())
+            if not self.flush_timer.isActive():
+                self.flush_timer.start()
             return
         
         # Add to unique entries set
@@ -704,8 +843,25 @@ class DataCollectionApp(QMainWindow):
         # Add data to our collection
         self.collected_data.append(cleaned_data)
         
-        # Add data to table
-        self.results_card.add_data(cleaned_data)
+        # Queue the row for the next table flush
+        self.pending_rows.append(cleaned_data)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+    
+    def flush_pending_rows(self):
+        """Insert all queued rows into the results table at once"""
+        self.flush_timer.stop()
+        if self.pending_duplicates:
+            names, self.pending_duplicates = self.pending_duplicates, []
+            if len(names) == 1:
+                self.log_message(f"Duplicate entry skipped: {names[0]}")
+            else:
+                self.log_message(f"{len(names)} duplicate entries skipped: {', '.join(names)}")
+        if not self.pending_rows:
+            return
+        
+        rows, self.pending_rows = self.pending_rows, []
+        self.results_card.add_rows(rows)
         
         # Update results count
         count = len(self.collected_data)
@@ -717,7 +873,7 @@ class DataCollectionApp(QMainWindow):
     
     def clean_data_entry(self, data):
         """Clean a single data entry"""
-        cleaned = {}
+        cleaned = _CLEANED_TEMPLATE.copy()
         
         # Clean name
         name = data.get('name', 'N/A')
@@ -731,7 +887,7 @@ class DataCollectionApp(QMainWindow):
         phone = data.get('phone', 'N/A')
         if phone != 'N/A':
             # Remove all non-digit characters except for leading '+'
-            phone = re.sub(r'[^\d+]', '', phone)
+            phone = _RE_PHONE_JUNK.sub('', phone)
             # Ensure country code is present if it's a valid phone number
             if phone and not phone.startswith('+') and len(phone) >= 10:
                 # Default to Nigeria country code if no country code is present
@@ -749,7 +905,7 @@ class DataCollectionApp(QMainWindow):
         if website != 'N/A':
             website = website.strip()
             # Ensure URL has proper format
-            if not website.startswith(('http://', 'https://')):
+            if not website.startswith(_URL_PREFIXES):
                 website = 'https://' + website
         cleaned['website'] = website
         
@@ -758,7 +914,7 @@ class DataCollectionApp(QMainWindow):
         if instagram != 'N/A':
             instagram = instagram.strip()
             # Ensure Instagram URL has proper format
-            if not instagram.startswith(('http://', 'https://')):
+            if not instagram.startswith(_URL_PREFIXES):
                 if instagram.startswith('@'):
                     instagram = f"https://instagram.com/{instagram[1:]}"
                 else:
@@ -774,10 +930,12 @@ class DataCollectionApp(QMainWindow):
         cleaned['address'] = address
         
         # Clean other fields
-        for field in ['country', 'state', 'location', 'hours', 'products_services', 'image_path']:
+        for field in _OTHER_FIELDS:
             value = data.get(field, 'N/A')
             if value != 'N/A' and isinstance(value, str):
                 value = value.strip()
+                if field in _INTERNED_FIELDS:
+                    value = sys.intern(value)  # Repeated on nearly every row; share one copy
             cleaned[field] = value
         
         return cleaned
@@ -789,52 +947,54 @@ class DataCollectionApp(QMainWindow):
             return
         
         self.log_message("Starting data cleaning...")
-        cleaned_count = 0
+        self.clean_action.setEnabled(False)
+        
+        # Clean and de-duplicate a snapshot in one vectorized pass on the thread pool;
+        # entries keep streaming into collected_data meanwhile
+        self.cleaning_source = self.collected_data
+        self.cleaning_count = len(self.collected_data)
+        self.clean_worker = CleanWorker(list(self.collected_data))
+        self.clean_worker.signals.finished.connect(self.apply_cleaned_data)
+        self.clean_worker.signals.error.connect(self.clean_data_failed)
+        QThreadPool.globalInstance().start(self.clean_worker)
+    
+    def apply_cleaned_data(self, cleaned_data):
+        """Replace the collected data with the cleaning worker's result"""
+        self.clean_action.setEnabled(True)
+        self.clean_worker = None
+        if self.collected_data is not self.cleaning_source:
+            self.log_message("Data was cleared during cleaning; cleaned result discarded.")
+            return
         
-        # Create a new list for cleaned data
-        cleaned_data = []
-        self.unique_entries = set()  # Reset unique entries set
+        original_count = self.cleaning_count
+        cleaned_count = len(cleaned_data)
         
-        for i, data in enumerate(self.collected_data):
-            # Clean the data entry
-            cleaned_entry = self.clean_data_entry(data)
-            
-            # Create a unique key based on name and address
-            name = cleaned_entry.get('name', '').strip().lower()
-            address = cleaned_entry.get('address', '').strip().lower()
-            unique_key = (name, address)
-            
-            # Skip if this is a duplicate entry
-            if unique_key in self.unique_entries:
-                self.log_message(f"Duplicate entry removed: {name}")
-                continue
-            
-            # Add to unique entries set and cleaned data
-            self.unique_entries.add(unique_key)
-            cleaned_data.append(cleaned_entry)
-            cleaned_count += 1
-            
-            if cleaned_count % 5 == 0:
-                self.log_message(f"Cleaned {cleaned_count} of {len(self.collected_data)} entries")
+        # Keep entries that arrived while cleaning ran, unless cleaning left an equal one
+        seen = {_entry_key(data) for data in cleaned_data}
+        for data in self.collected_data[original_count:]:
+            key = _entry_key(data)
+            if key not in seen:
+                seen.add(key)
+                cleaned_data.append(data)
         
-        # Replace the collected data with cleaned data
+        # Replace the collected data with cleaned data; it is already unique,
+        # so the table is reloaded directly rather than re-added row by row
         self.collected_data = cleaned_data
+        self.reload_table()
         
-        # Refresh table with cleaned data
-        self.refresh_table()
-        
-        removed_count = len(self.collected_data) - cleaned_count
+        removed_count = original_count - cleaned_count
         self.log_message(f"Data cleaning completed. Removed {removed_count} duplicate entries.")
         QMessageBox.information(self, "Data Cleaning Complete", 
                                f"Data cleaning completed.\n\nTotal entries: {cleaned_count}\nRemoved duplicates: {removed_count}")
     
-    def add_data_to_table(self, data):
-        """Add data to table (called when collection is complete)"""
-        # This method is now just for backward compatibility
-        # The real-time updates are handled by add_real_time_data
-        pass
+    def clean_data_failed(self, message):
+        self.clean_action.setEnabled(True)
+        self.clean_worker = None
+        self.log_message(f"Data cleaning failed: {message}")
+        QMessageBox.warning(self, "Data Cleaning Failed", f"Data cleaning failed: {message}")
     
     def collection_finished(self):
+        self.flush_pending_rows()
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         collected_count = len(self.collected_data)
@@ -884,10 +1044,23 @@ class DataCollectionApp(QMainWindow):
     def clear_data(self):
         self.collected_data = []
         self.unique_entries = set()  # Reset unique entries set
+        self.pending_rows = []
+        self.pending_duplicates = []
+        self.flush_timer.stop()
         self.results_card.clear_data()
         self.status_bar.showMessage("Data cleared.")
         self.log_message("Data cleared.")
     
+    def reload_table(self):
+        """Repopulate the results table from collected_data, which must already be cleaned and unique"""
+        self.pending_rows = []
+        self.pending_duplicates = []
+        self.flush_timer.stop()
+        self.unique_entries = {_entry_key(data) for data in self.collected_data}
+        self.results_card.clear_data()
+        self.results_card.add_rows(list(self.collected_data))
+        self.results_card.update_count(len(self.collected_data))
+    
     def refresh_table(self):
         # Clear and repopulate the table
         current_data = self.collected_data.copy()
@@ -895,6 +1068,7 @@ class DataCollectionApp(QMainWindow):
         
         for data in current_data:
             self.add_real_time_data(data)
+        self.flush_pending_rows()
         
         self.status_bar.showMessage("Table refreshed.")
         self.log_message("Table refreshed.")
@@ -905,9 +1079,18 @@ class DataCollectionApp(QMainWindow):
             QMessageBox.warning(self, "No Data", "No data to validate.")
             return
         
+        import phonenumbers
+        from core.data_processor import DataProcessor
+        
         self.log_message("Starting data validation...")
         validated_count = 0
         
+        # Check every website concurrently before walking the entries
+        website_ok = {}
+        if self.settings.get('validate_website'):
+            website_ok = DataProcessor.validate_website_urls(
+                data.get('website') for data in self.collected_data if data.get('website') != 'N/A')
+        
         for i, data in enumerate(self.collected_data):
             # Validate phone number
             if self.settings.get('validate_phone') and data.get('phone') != 'N/A':
@@ -922,18 +1105,12 @@ class DataCollectionApp(QMainWindow):
             # Validate email
             if self.settings.get('validate_email') and data.get('email') != 'N/A':
                 email = data.get('email')
-                email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                if not re.match(email_pattern, email):
+                if not _RE_VALID_EMAIL.match(email):
                     self.collected_data[i]['email'] = 'N/A (Invalid)'
             
             # Validate website
             if self.settings.get('validate_website') and data.get('website') != 'N/A':
-                website = data.get('website')
-                try:
-                    response = requests.head(website, timeout=5)
-                    if response.status_code >= 400:
-                        self.collected_data[i]['website'] = 'N/A (Invalid)'
-                except:
+                if not website_ok.get(data.get('website')):
                     self.collected_data[i]['website'] = 'N/A (Invalid)'
             
             validated_count += 1
@@ -1010,13 +1187,14 @@ class DataCollectionApp(QMainWindow):
             
             # Export to CSV
             csv_path = os.path.join(export_folder, "collected_data.csv")
+            import pandas as pd
             df = pd.DataFrame(csv_data)
             df.to_csv(csv_path, index=False)
             
             # Export to JSON
             json_path = os.path.join(export_folder, "collected_data.json")
-            with open(json_path, 'w') as f:
-                json.dump(self.collected_data, f, indent=2)
+            with open(json_path, 'wb') as f:
+                f.write(json_io.dumps(self.collected_data, indent=True))
             
             # Copy and rename images
             images_copied = 0
@@ -1024,7 +1202,7 @@ class DataCollectionApp(QMainWindow):
                 image_path = item.get('image_path')
                 if image_path and image_path != 'N/A' and os.path.exists(image_path):
                     # Create a safe filename from the business name
-                    safe_name = re.sub(r'[^\w\s-]', '', item.get('name', 'unknown')).strip().replace(' ', '_')
+                    safe_name = _RE_UNSAFE_FILENAME.sub('', item.get('name', 'unknown')).strip().replace(' ', '_')
                     new_image_path = os.path.join(export_folder, f"{safe_name}.jpg")
                     
                     # Copy the image
@@ -1107,6 +1285,7 @@ class DataCollectionApp(QMainWindow):
             "headless": self.web_scraping_card.headless_toggle.isChecked()
         }
 
+        from core.web_scraping import WebScrapeWorker
         self.web_scrape_worker = WebScrapeWorker(params)
         self.web_scrape_worker.progress.connect(self.on_web_progress)
         self.web_scrape_worker.row_found.connect(self.on_web_row_found)
@@ -1132,7 +1311,7 @@ class DataCollectionApp(QMainWindow):
             self.log_message("Stopping web scraping...")
     
     def clear_web_results(self):
-        self.web_scraped_data = []
+        self.web_scraped_data = ScrapedTable()
         self.web_unique_entries = set()
         self.web_scraping_card.progress_bar.setVisible(False)
         self.web_scraping_card.progress_label.setText("Ready")
@@ -1148,26 +1327,9 @@ class DataCollectionApp(QMainWindow):
             return
 
         try:
-            # Prepare data for CSV
-            csv_data = []
-            for item in self.web_scraped_data:
-                csv_item = {
-                    'Email': item.email,
-                    'Business Name': item.name,
-                    'Website': item.website,
-                    'Platform': item.platform,
-                    'Niche/Category': item.niche,
-                    'Instagram': item.instagram,
-                    'Other Socials': item.social,
-                    'WhatsApp': item.whatsapp,
-                    'Location': item.location,
-                    'Address': item.address,
-                    'Source Page': item.source_page
-                }
-                csv_data.append(csv_item)
-            
-            # Export to CSV
-            df = pd.DataFrame(csv_data)
+            # Export to CSV; headers follow ScrapedItem's field order
+            import pandas as pd
+            df = pd.DataFrame(self.web_scraped_data.renamed(WEB_CSV_HEADERS))
             df.to_csv(path, index=False)
             
             QMessageBox.information(
@@ -1189,7 +1351,7 @@ class DataCollectionApp(QMainWindow):
         # Create a unique key based on name and website to avoid duplicates
         name = item.name.strip().lower() if item.name else ""
         website = item.website.strip().lower() if item.website else ""
-        unique_key = (name, website)
+        unique_key = _dup_key(name, website)
         
         # Skip if this is a duplicate entry
         if unique_key in self.web_unique_entries:
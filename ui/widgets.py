@@ -1,13 +1,15 @@
 # ui/widgets.py
-from PyQt5.QtCore import Qt
+import json
+from PyQt5.QtCore import Qt, QAbstractItemModel, QAbstractTableModel, QModelIndex, QTimer
+from PyQt5.QtGui import QPixmap, QColor
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, 
-    QTableWidget, QTableWidgetItem, QComboBox, QSpinBox, QProgressBar, 
-    QGroupBox, QFormLayout, QCheckBox, QTextEdit, QFrame, QGridLayout,
+    QTableView, QAbstractItemView, QHeaderView, QStyledItemDelegate, QComboBox, QSpinBox, QProgressBar, 
+    QGroupBox, QFormLayout, QCheckBox, QFrame, QGridLayout,
     QDoubleSpinBox, QPlainTextEdit, QSpacerItem, QSizePolicy, QSystemTrayIcon,
-    QMenu, QStyle, QStackedWidget, QRadioButton, QButtonGroup
+    QMenu, QStyle, QStackedWidget, QTabWidget
 )
-from core.utils import NIGERIAN_STATES
+from core.utils import NIGERIAN_STATES, THEMES
 
 class SearchParametersCard(QFrame):
     def __init__(self, parent=None):
@@ -114,6 +116,11 @@ class SearchParametersCard(QFrame):
         self.skip_missing_social_checkbox.setChecked(True)
         advanced_layout.addWidget(self.skip_missing_social_checkbox)
         
+        # Collect images checkbox
+        self.collect_images_checkbox = QCheckBox("Collect business images (slower)")
+        self.collect_images_checkbox.setChecked(False)
+        advanced_layout.addWidget(self.collect_images_checkbox)
+        
         form_layout.addWidget(QLabel("Advanced Options"), row, 0)
         form_layout.addWidget(advanced_group, row, 1)
         
@@ -151,7 +158,7 @@ class NetworkStatusCard(QFrame):
         
         network_status_layout = QHBoxLayout()
         self.connection_label = QLabel("Connected")
-        self.connection_label.setStyleSheet("color: green;")
+        self.connection_label.setProperty("connection", "connected")  # Colored by the theme's QLabel[connection=...] rules
         network_status_layout.addWidget(QLabel("Internet Status:"))
         network_status_layout.addWidget(self.connection_label)
         network_status_layout.addStretch()
@@ -307,6 +314,246 @@ class WebScrapingCard(QFrame):
         layout.addWidget(progress_group)
         layout.addStretch()
 
+class ResultsTableModel(QAbstractTableModel):
+    """Table model exposing collected business entries to a QTableView."""
+    
+    COLUMNS = (
+        ('name', "Name"),
+        ('phone', "Phone"),
+        ('email', "Email"),
+        ('website', "Website"),
+        ('instagram', "Instagram"),
+        ('country', "Country"),
+        ('state', "State"),
+        ('location', "Location"),
+        ('hours', "Hours"),
+        ('products_services', "Products/Services"),
+        ('image_path', "Image"),
+    )
+    IMAGE_COLUMN = 10
+    
+    # Entries shown per page; the view only ever holds one page of the filtered entries
+    PAGE_SIZE = 1000
+    
+    # Value states reported through Qt.UserRole
+    STATUS_OK = 0
+    STATUS_MISSING = 1
+    STATUS_INVALID = 2
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._matches = None  # Indexes into _rows of entries matching the filter; None when unfiltered
+        self._offset = 0  # Position among the filtered entries of the first one on the current page
+        self.filter_text = ""
+        self._haystacks = {}  # id(entry) -> its lowercased column values, built on first filter
+        self._pixmaps = {}  # image path -> scaled thumbnail
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else max(0, min(self.PAGE_SIZE, self.match_count() - self._offset))
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = self.entry(index.row())
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            if column == self.IMAGE_COLUMN:
+                image_path = row.get('image_path', 'N/A')
+                if image_path == 'N/A':
+                    return 'N/A'
+                return "" if self._thumbnail(image_path) is not None else "Image"
+            return self.format_value(self.COLUMNS[column][0], row.get(self.COLUMNS[column][0], 'N/A'))
+        
+        if role == Qt.DecorationRole and column == self.IMAGE_COLUMN:
+            image_path = row.get('image_path', 'N/A')
+            if image_path != 'N/A':
+                return self._thumbnail(image_path)
+            return None
+        
+        if role == Qt.UserRole:
+            value = row.get(self.COLUMNS[column][0], 'N/A')
+            if value == 'N/A (Invalid)':
+                return self.STATUS_INVALID
+            if value == 'N/A' or not value:
+                return self.STATUS_MISSING
+            return self.STATUS_OK
+        
+        if role == Qt.TextAlignmentRole:
+            if column == self.IMAGE_COLUMN:
+                return Qt.AlignCenter
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return None
+    
+    @staticmethod
+    def format_value(key, value):
+        """Format a raw entry value for display."""
+        if value == 'N/A' or not isinstance(value, str):
+            return value
+        
+        # Format hours for display
+        if key == 'hours':
+            try:
+                hours_dict = json.loads(value)
+                return "\n".join([f"{day}: {time}" for day, time in hours_dict.items()])
+            except:
+                return value
+        
+        # Format products/services for display
+        if key == 'products_services':
+            try:
+                services_list = json.loads(value)
+                services_text = "\n".join(services_list[:5])  # Show first 5 items
+                if len(services_list) > 5:
+                    services_text += f"\n... and {len(services_list) - 5} more"
+                return services_text
+            except:
+                return value
+        
+        return value
+    
+    def _thumbnail(self, image_path):
+        """Return a cached thumbnail for an image path, or None if it cannot be loaded."""
+        if image_path not in self._pixmaps:
+            pixmap = QPixmap(image_path)
+            if pixmap.isNull():
+                self._pixmaps[image_path] = None
+            else:
+                self._pixmaps[image_path] = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return self._pixmaps[image_path]
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Reorder entries in place, keeping persistent indexes (and selections) valid."""
+        key = self.COLUMNS[column][0]
+        self.layoutAboutToBeChanged.emit([], QAbstractItemModel.VerticalSortHint)
+        
+        old_persistent = self.persistentIndexList()
+        old_rows = [self.entry(index.row()) for index in old_persistent]
+        
+        self._rows.sort(key=lambda row: str(row.get(key, '')).lower(),
+                        reverse=(order == Qt.DescendingOrder))
+        if self._matches is not None:
+            self._matches = [i for i, row in enumerate(self._rows) if self.matches_filter(row)]
+        
+        # Map each persistent index to its entry's new position; entries sorted
+        # off the current page get an invalid index
+        positions = {id(self.entry_at(i)): i - self._offset for i in range(self.match_count())}
+        new_persistent = [self.index(positions.get(id(row), -1), index.column())
+                          for row, index in zip(old_rows, old_persistent)]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        
+        self.layoutChanged.emit([], QAbstractItemModel.VerticalSortHint)
+    
+    def append_rows(self, rows):
+        """Append entries to the end of the model.
+        
+        Returns how many rows were inserted into the current page; entries that
+        fail the filter or land on a later page are stored without an insert.
+        """
+        if not rows:
+            return 0
+        start = len(self._rows)
+        new_matches = None
+        added = len(rows)
+        if self._matches is not None:
+            new_matches = [start + i for i, row in enumerate(rows) if self.matches_filter(row)]
+            added = len(new_matches)
+        
+        first = self.rowCount()
+        visible = 0
+        if self._offset + first == self.match_count():  # Current page is the last one
+            visible = min(self.PAGE_SIZE - first, added)
+        if visible:
+            self.beginInsertRows(QModelIndex(), first, first + visible - 1)
+        self._rows.extend(rows)
+        if new_matches:
+            self._matches.extend(new_matches)
+        if visible:
+            self.endInsertRows()
+        return visible
+    
+    def match_count(self):
+        """Number of entries passing the filter, across all pages."""
+        return len(self._rows) if self._matches is None else len(self._matches)
+    
+    def entry_at(self, position):
+        """Entry at a position among the filtered entries."""
+        return self._rows[position if self._matches is None else self._matches[position]]
+    
+    def entry(self, row):
+        """Entry shown at a row of the current page."""
+        return self.entry_at(self._offset + row)
+    
+    def matches_filter(self, row):
+        """Whether an entry contains the filter text in any column, ignoring case."""
+        haystack = self._haystacks.get(id(row))
+        if haystack is None:
+            # Lowercased once per entry rather than once per keystroke
+            haystack = self._haystacks[id(row)] = "\n".join(
+                str(row.get(key, 'N/A')).lower() for key, _ in self.COLUMNS)
+        return self.filter_text in haystack
+    
+    def set_filter_text(self, filter_text):
+        """Filter every entry on lowercase text, back on the first page; an empty string shows all."""
+        self.beginResetModel()
+        self.filter_text = filter_text
+        if filter_text:
+            self._matches = [i for i, row in enumerate(self._rows) if self.matches_filter(row)]
+        else:
+            self._matches = None
+        self._offset = 0
+        self.endResetModel()
+    
+    def page(self):
+        return self._offset // self.PAGE_SIZE
+    
+    def page_count(self):
+        return max(1, -(-self.match_count() // self.PAGE_SIZE))
+    
+    def set_page(self, page):
+        """Show another page of entries, clamped to the pages that exist."""
+        page = max(0, min(page, self.page_count() - 1))
+        if page * self.PAGE_SIZE == self._offset:
+            return
+        self.beginResetModel()
+        self._offset = page * self.PAGE_SIZE
+        self.endResetModel()
+    
+    def clear(self):
+        """Remove all entries from the model."""
+        self.beginResetModel()
+        self._rows = []
+        self._matches = [] if self.filter_text else None
+        self._offset = 0
+        self._haystacks = {}
+        self._pixmaps = {}
+        self.endResetModel()
+
+class ValueStatusDelegate(QStyledItemDelegate):
+    """Tints missing and invalid cells at paint time, so no per-cell brushes are stored."""
+    
+    STATUS_COLORS = {
+        ResultsTableModel.STATUS_MISSING: QColor(128, 128, 128, 30),
+        ResultsTableModel.STATUS_INVALID: QColor(220, 53, 69, 60),
+    }
+    
+    def paint(self, painter, option, index):
+        color = self.STATUS_COLORS.get(index.data(Qt.UserRole))
+        if color is not None:
+            painter.fillRect(option.rect, color)
+        super().paint(painter, option, index)
+
 class ResultsCard(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -343,105 +590,105 @@ class ResultsCard(QFrame):
         self.filter_edit.setPlaceholderText("Filter results...")
         table_controls_layout.addWidget(self.filter_edit)
         
+        # Sizing to contents walks every row, so it is only done on request
+        fit_columns_btn = QPushButton("Auto-fit")
+        fit_columns_btn.setObjectName("SecondaryButton")
+        table_controls_layout.addWidget(fit_columns_btn)
+        
         # Add export button to table controls
         export_table_btn = QPushButton("Export CSV")
         export_table_btn.setObjectName("SecondaryButton")
         table_controls_layout.addWidget(export_table_btn)
         
-        # Create table
-        self.data_table = QTableWidget()
-        self.data_table.setColumnCount(11)  # Added state column
-        self.data_table.setHorizontalHeaderLabels([
-            "Name", "Phone", "Email", "Website", "Instagram", 
-            "Country", "State", "Location", "Hours", "Products/Services", "Image"
-        ])
+        # Create table backed by a model so rows are not materialized as per-cell items;
+        # the model filters and pages its entries itself
+        self.model = ResultsTableModel(self)
+        self.data_table = QTableView()
+        self.data_table.setModel(self.model)
+        self.data_table.setItemDelegate(ValueStatusDelegate(self.data_table))
         
         # Make table fill the available space
         self.data_table.horizontalHeader().setStretchLastSection(True)
         self.data_table.verticalHeader().setVisible(False)
+        
+        # Fixed section sizes keep inserts from re-measuring existing rows
+        self.data_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.data_table.horizontalHeader().setDefaultSectionSize(180)
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.data_table.verticalHeader().setDefaultSectionSize(self.data_table.fontMetrics().height() + 4)
         self.data_table.setAlternatingRowColors(True)
         self.data_table.setSortingEnabled(True)
         self.data_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         
+        # Page navigation; the table shows one page of entries at a time
+        page_controls = QWidget()
+        page_controls_layout = QHBoxLayout(page_controls)
+        page_controls_layout.setContentsMargins(0, 0, 0, 0)
+        self.prev_page_btn = QPushButton("Previous")
+        self.prev_page_btn.setObjectName("SecondaryButton")
+        self.next_page_btn = QPushButton("Next")
+        self.next_page_btn.setObjectName("SecondaryButton")
+        self.page_label = QLabel()
+        page_controls_layout.addStretch()
+        page_controls_layout.addWidget(self.prev_page_btn)
+        page_controls_layout.addWidget(self.page_label)
+        page_controls_layout.addWidget(self.next_page_btn)
+        page_controls_layout.addStretch()
+        
         # Add components to layout
         layout.addWidget(results_header)
         layout.addWidget(table_controls)
         layout.addWidget(self.data_table, 1)  # Give table stretch factor of 1
+        layout.addWidget(page_controls)
         
         # Connect signals
+        fit_columns_btn.clicked.connect(self.fit_to_contents)
         export_table_btn.clicked.connect(self.export_data)
+        self.prev_page_btn.clicked.connect(lambda: self.show_page(self.model.page() - 1))
+        self.next_page_btn.clicked.connect(lambda: self.show_page(self.model.page() + 1))
+        self.update_page_controls()
     
     def add_data(self, data):
         """Add data to table"""
-        row_position = self.data_table.rowCount()
-        self.data_table.insertRow(row_position)
-        
-        self.data_table.setItem(row_position, 0, QTableWidgetItem(data.get('name', 'N/A')))
-        self.data_table.setItem(row_position, 1, QTableWidgetItem(data.get('phone', 'N/A')))
-        self.data_table.setItem(row_position, 2, QTableWidgetItem(data.get('email', 'N/A')))
-        self.data_table.setItem(row_position, 3, QTableWidgetItem(data.get('website', 'N/A')))
-        self.data_table.setItem(row_position, 4, QTableWidgetItem(data.get('instagram', 'N/A')))
-        self.data_table.setItem(row_position, 5, QTableWidgetItem(data.get('country', 'N/A')))
-        self.data_table.setItem(row_position, 6, QTableWidgetItem(data.get('state', 'N/A')))
-        self.data_table.setItem(row_position, 7, QTableWidgetItem(data.get('location', 'N/A')))
-        
-        # Format hours for display
-        hours = data.get('hours', 'N/A')
-        if hours != 'N/A':
-            try:
-                import json
-                hours_dict = json.loads(hours)
-                hours_text = "\n".join([f"{day}: {time}" for day, time in hours_dict.items()])
-                self.data_table.setItem(row_position, 8, QTableWidgetItem(hours_text))
-            except:
-                self.data_table.setItem(row_position, 8, QTableWidgetItem(hours))
-        else:
-            self.data_table.setItem(row_position, 8, QTableWidgetItem('N/A'))
-        
-        # Format products/services for display
-        products_services = data.get('products_services', 'N/A')
-        if products_services != 'N/A':
-            try:
-                import json
-                services_list = json.loads(products_services)
-                services_text = "\n".join(services_list[:5])  # Show first 5 items
-                if len(services_list) > 5:
-                    services_text += f"\n... and {len(services_list) - 5} more"
-                self.data_table.setItem(row_position, 9, QTableWidgetItem(services_text))
-            except:
-                self.data_table.setItem(row_position, 9, QTableWidgetItem(products_services))
-        else:
-            self.data_table.setItem(row_position, 9, QTableWidgetItem('N/A'))
-        
-        # For image, just show the path or a thumbnail
-        image_path = data.get('image_path', 'N/A')
-        if image_path != 'N/A':
-            try:
-                from PyQt5.QtGui import QPixmap
-                pixmap = QPixmap(image_path)
-                if not pixmap.isNull():
-                    pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    image_label = QLabel()
-                    image_label.setPixmap(pixmap)
-                    image_label.setAlignment(Qt.AlignCenter)
-                    self.data_table.setCellWidget(row_position, 10, image_label)
-                else:
-                    self.data_table.setItem(row_position, 10, QTableWidgetItem("Image"))
-            except:
-                self.data_table.setItem(row_position, 10, QTableWidgetItem("Image"))
-        else:
-            self.data_table.setItem(row_position, 10, QTableWidgetItem("N/A"))
-        
-        # Resize rows to content
+        self.add_rows([data])
+    
+    def add_rows(self, rows):
+        """Add several entries to the table in one insert"""
+        # Repaint once after the insert and scroll rather than after each;
+        # the model filters the new rows as they are appended
+        self.data_table.setUpdatesEnabled(False)
+        try:
+            # Scroll to the new rows, if any landed on the page being shown
+            if self.model.append_rows(rows):
+                self.data_table.scrollToBottom()
+            self.update_page_controls()
+        finally:
+            self.data_table.setUpdatesEnabled(True)
+    
+    def show_page(self, page):
+        """Switch the table to another page of results"""
+        self.model.set_page(page)
+        self.update_page_controls()
+    
+    def update_page_controls(self):
+        """Refresh the page label and enable only the moves that exist"""
+        page, count = self.model.page(), self.model.page_count()
+        self.page_label.setText(f"Page {page + 1} of {count}")
+        self.prev_page_btn.setEnabled(page > 0)
+        self.next_page_btn.setEnabled(page < count - 1)
+    
+    def fit_to_contents(self):
+        """Resize columns and rows to fit their contents once."""
+        self.data_table.resizeColumnsToContents()
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.data_table.resizeRowsToContents()
-        
-        # Scroll to the new row
-        self.data_table.scrollToBottom()
+        self.data_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
     
     def clear_data(self):
         """Clear all data from table"""
-        self.data_table.setRowCount(0)
+        self.model.clear()
         self.update_count(0)
+        self.update_page_controls()
     
     def update_count(self, count):
         """Update the results count label"""
@@ -453,18 +700,14 @@ class ResultsCard(QFrame):
         pass
     
     def filter_results(self, filter_text):
-        """Filter results based on filter text"""
-        for row in range(self.data_table.rowCount()):
-            match = False
-            for col in range(self.data_table.columnCount()):
-                index = self.data_table.model().index(row, col)
-                item_text = self.data_table.model().data(index)
-                if item_text and filter_text in str(item_text).lower():
-                    match = True
-                    break
-            self.data_table.setRowHidden(row, not match)
+        """Filter all results based on filter text, paging over the matches"""
+        self.model.set_filter_text(filter_text)
+        self.update_page_controls()
 
 class LogsCard(QFrame):
+    # Oldest lines are dropped past this, keeping append cost flat over long runs
+    MAX_LOG_LINES = 10000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("Card")
@@ -486,9 +729,11 @@ class LogsCard(QFrame):
         logs_header_layout.addWidget(logs_title)
         logs_header_layout.addStretch()
         
-        # Create log text area
-        self.log_text = QTextEdit()
+        # Create log text area; plain text lays out one fixed-format block per line,
+        # so appending does not re-lay out the whole rich-text document
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.MAX_LOG_LINES)
         self.log_text.setMaximumHeight(150)
         
         # Add components to layout
@@ -497,31 +742,100 @@ class LogsCard(QFrame):
     
     def add_log(self, timestamp, message):
         """Add a log entry"""
-        self.log_text.append(f"[{timestamp}] {message}")
+        self.log_text.appendPlainText(f"[{timestamp}] {message}")
         # Auto-scroll to bottom
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
 class SettingsDialog(QDialog):
+    # Spin boxes and check boxes that map straight onto settings, in settings order:
+    # (settings key, widget attribute, section, label, (min, max) or None for a check box, default)
+    SETTINGS_FIELDS = (
+        ('thread_count', 'thread_count', 'perf', "Parallel Threads:", (1, 8), 4),
+        ('batch_size', 'batch_size', 'perf', "Batch Size:", (1, 10), 4),
+        ('skip_missing_social', 'skip_missing_social_checkbox', 'filter', "Skip entries without website or Instagram", None, True),
+        ('requests_per_minute', 'requests_per_minute', 'rate', "Requests per minute:", (1, 60), 20),
+        ('random_delay_min', 'random_delay_min', 'rate', "Min delay (seconds):", (1, 30), 1),
+        ('random_delay_max', 'random_delay_max', 'rate', "Max delay (seconds):", (1, 60), 2),
+        ('validate_phone', 'validate_phone_checkbox', 'validation', "Validate phone numbers", None, True),
+        ('validate_email', 'validate_email_checkbox', 'validation', "Validate email addresses", None, True),
+        ('validate_website', 'validate_website_checkbox', 'validation', "Validate website URLs", None, True),
+        ('enable_web_scraping', 'enable_web_scraping_checkbox', 'web', "Enable Web Scraping for Google", None, True),
+        ('web_scraping_workers', 'web_scraping_workers', 'web', "Concurrent Workers:", (1, 15), 5),
+    )
+    
+    # Settings edited by hand-built widgets, with their defaults, in settings order
+    BASE_DEFAULTS = {'api_key': '', 'use_proxy': False, 'proxy_file': '', 'use_tor': False, 'theme': 'Light'}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Advanced Settings")
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
         
+        # Current value of every setting; widgets read from it when their tab is built
+        self.values = dict(self.BASE_DEFAULTS)
+        self.values.update((key, default) for key, _, _, _, _, default in self.SETTINGS_FIELDS)
+        self.bindings = {}  # Setting key -> (getter, setter) for widgets built so far
+        
         # Main layout for the dialog
         main_layout = QVBoxLayout(self)
         
-        # Create a scroll area
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        # Each tab's widgets are only created the first time the tab is shown
+        self.tabs = QTabWidget()
+        self.tab_builders = [
+            ("General", self.build_general_tab),
+            ("Network", self.build_network_tab),
+            ("Collection", self.build_collection_tab),
+        ]
+        self.built_tabs = set()
+        for title, _ in self.tab_builders:
+            page = QWidget()
+            QVBoxLayout(page)
+            self.tabs.addTab(page, title)
+        self.tabs.currentChanged.connect(self.ensure_tab_built)
+        main_layout.addWidget(self.tabs)
+        self.ensure_tab_built(0)
+        
+        # Non-blocking confirmation shown above the buttons, cleared after two seconds
+        self.status_label = QLabel("")
+        main_layout.addWidget(self.status_label)
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(2000)
+        self.status_timer.timeout.connect(self.status_label.clear)
+        
+        # Buttons - now with Apply button
+        buttons = QDialogButtonBox(QDialogButtonBox.Apply | QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        main_layout.addWidget(buttons)
         
-        # Create a widget to hold all settings
-        settings_widget = QWidget()
-        settings_layout = QVBoxLayout(settings_widget)
+        # Store reference to parent for applying settings
+        self.parent = parent
+        self.proxy_dialog = None  # Created on first Browse click
         
+        # Rapid Apply clicks collapse into one apply once they pause
+        self.apply_timer = QTimer(self)
+        self.apply_timer.setSingleShot(True)
+        self.apply_timer.setInterval(150)
+        self.apply_timer.timeout.connect(self.do_apply_settings)
+    
+    def ensure_tab_built(self, index):
+        if index < 0 or index in self.built_tabs:
+            return
+        self.built_tabs.add(index)
+        layout = self.tabs.widget(index).layout()
+        self.tab_builders[index][1](layout)
+        layout.addStretch()
+    
+    def bind(self, key, getter, setter):
+        """Register a widget for a setting and show the setting's current value in it."""
+        self.bindings[key] = (getter, setter)
+        setter(self.values[key])
+    
+    def build_general_tab(self, layout):
         # API Key section
         api_group = QGroupBox("Google Places API")
         api_layout = QFormLayout()
@@ -529,43 +843,33 @@ class SettingsDialog(QDialog):
         self.api_key_input = QLineEdit()
         self.api_key_input.setPlaceholderText("Enter your Google Places API key")
         api_layout.addRow("API Key:", self.api_key_input)
+        self.bind('api_key', self.api_key_input.text, self.api_key_input.setText)
         
         api_group.setLayout(api_layout)
-        settings_layout.addWidget(api_group)
+        layout.addWidget(api_group)
         
         # Theme selection section
         theme_group = QGroupBox("Appearance")
-        theme_layout = QVBoxLayout()
-        
-        self.theme_group = QButtonGroup(self)
-        
-        self.light_theme_radio = QRadioButton("Light Theme")
-        self.light_theme_radio.setChecked(True)
-        self.theme_group.addButton(self.light_theme_radio)
+        theme_layout = QFormLayout()
         
-        self.dark_theme_radio = QRadioButton("Dark Theme")
-        self.theme_group.addButton(self.dark_theme_radio)
-        
-        self.blue_theme_radio = QRadioButton("Blue Theme")
-        self.theme_group.addButton(self.blue_theme_radio)
-        
-        self.green_theme_radio = QRadioButton("Green Theme")
-        self.theme_group.addButton(self.green_theme_radio)
-        
-        theme_layout.addWidget(self.light_theme_radio)
-        theme_layout.addWidget(self.dark_theme_radio)
-        theme_layout.addWidget(self.blue_theme_radio)
-        theme_layout.addWidget(self.green_theme_radio)
+        # Each item carries its theme name as data; Light comes first and is the fallback
+        self.theme_combo = QComboBox()
+        for theme_name in THEMES:
+            self.theme_combo.addItem(f"{theme_name} Theme", theme_name)
+        theme_layout.addRow("Theme:", self.theme_combo)
+        self.bind('theme', self.theme_combo.currentData, self.set_theme)
         
         theme_group.setLayout(theme_layout)
-        settings_layout.addWidget(theme_group)
-        
+        layout.addWidget(theme_group)
+    
+    def build_network_tab(self, layout):
         # Proxy settings
         proxy_group = QGroupBox("Proxy Settings")
         proxy_layout = QVBoxLayout()
         
         self.use_proxy_checkbox = QCheckBox("Use proxy rotation")
         proxy_layout.addWidget(self.use_proxy_checkbox)
+        self.bind('use_proxy', self.use_proxy_checkbox.isChecked, self.use_proxy_checkbox.setChecked)
         
         proxy_file_layout = QHBoxLayout()
         self.proxy_file_input = QLineEdit()
@@ -576,202 +880,116 @@ class SettingsDialog(QDialog):
         proxy_file_layout.addWidget(self.proxy_file_input)
         proxy_file_layout.addWidget(self.proxy_file_button)
         proxy_layout.addLayout(proxy_file_layout)
+        self.bind('proxy_file', self.proxy_file_input.text, self.proxy_file_input.setText)
         
         self.use_tor_checkbox = QCheckBox("Use Tor for IP rotation")
         proxy_layout.addWidget(self.use_tor_checkbox)
+        self.bind('use_tor', self.use_tor_checkbox.isChecked, self.use_tor_checkbox.setChecked)
         
         proxy_group.setLayout(proxy_layout)
-        settings_layout.addWidget(proxy_group)
-        
-        # Performance settings
-        perf_group = QGroupBox("Performance Settings")
-        perf_layout = QFormLayout()
-        
-        self.thread_count = QSpinBox()
-        self.thread_count.setMinimum(1)
-        self.thread_count.setMaximum(8)
-        self.thread_count.setValue(4)
-        perf_layout.addRow("Parallel Threads:", self.thread_count)
-        
-        self.batch_size = QSpinBox()
-        self.batch_size.setMinimum(1)
-        self.batch_size.setMaximum(10)
-        self.batch_size.setValue(4)
-        perf_layout.addRow("Batch Size:", self.batch_size)
-        
-        perf_group.setLayout(perf_layout)
-        settings_layout.addWidget(perf_group)
-        
-        # Data filtering settings
-        filter_group = QGroupBox("Data Filtering")
-        filter_layout = QVBoxLayout()
-        
-        self.skip_missing_social_checkbox = QCheckBox("Skip entries without website or Instagram")
-        self.skip_missing_social_checkbox.setChecked(True)
-        filter_layout.addWidget(self.skip_missing_social_checkbox)
-        
-        filter_group.setLayout(filter_layout)
-        settings_layout.addWidget(filter_group)
-        
-        # Rate limiting settings
-        rate_group = QGroupBox("Rate Limiting")
-        rate_layout = QFormLayout()
-        
-        self.requests_per_minute = QSpinBox()
-        self.requests_per_minute.setMinimum(1)
-        self.requests_per_minute.setMaximum(60)
-        self.requests_per_minute.setValue(20)
-        rate_layout.addRow("Requests per minute:", self.requests_per_minute)
-        
-        self.random_delay_min = QSpinBox()
-        self.random_delay_min.setMinimum(1)
-        self.random_delay_min.setMaximum(30)
-        self.random_delay_min.setValue(1)
-        rate_layout.addRow("Min delay (seconds):", self.random_delay_min)
+        layout.addWidget(proxy_group)
         
-        self.random_delay_max = QSpinBox()
-        self.random_delay_max.setMinimum(1)
-        self.random_delay_max.setMaximum(60)
-        self.random_delay_max.setValue(2)
-        rate_layout.addRow("Max delay (seconds):", self.random_delay_max)
-        
-        rate_group.setLayout(rate_layout)
-        settings_layout.addWidget(rate_group)
-        
-        # Data validation settings
-        validation_group = QGroupBox("Data Validation")
-        validation_layout = QVBoxLayout()
-        
-        self.validate_phone_checkbox = QCheckBox("Validate phone numbers")
-        self.validate_phone_checkbox.setChecked(True)
-        validation_layout.addWidget(self.validate_phone_checkbox)
-        
-        self.validate_email_checkbox = QCheckBox("Validate email addresses")
-        self.validate_email_checkbox.setChecked(True)
-        validation_layout.addWidget(self.validate_email_checkbox)
-        
-        self.validate_website_checkbox = QCheckBox("Validate website URLs")
-        self.validate_website_checkbox.setChecked(True)
-        validation_layout.addWidget(self.validate_website_checkbox)
-        
-        validation_group.setLayout(validation_layout)
-        settings_layout.addWidget(validation_group)
-        
-        # Web scraping settings
-        web_group = QGroupBox("Web Scraping")
-        web_layout = QVBoxLayout()
-        
-        self.enable_web_scraping_checkbox = QCheckBox("Enable Web Scraping for Google")
-        self.enable_web_scraping_checkbox.setChecked(True)
-        web_layout.addWidget(self.enable_web_scraping_checkbox)
-        
-        self.web_scraping_workers = QSpinBox()
-        self.web_scraping_workers.setMinimum(1)
-        self.web_scraping_workers.setMaximum(15)
-        self.web_scraping_workers.setValue(5)
-        web_layout.addWidget(QLabel("Concurrent Workers:"))
-        web_layout.addWidget(self.web_scraping_workers)
-        
-        web_group.setLayout(web_layout)
-        settings_layout.addWidget(web_group)
-        
-        # Set the widget as the scroll area's widget
-        scroll_area.setWidget(settings_widget)
-        
-        # Add the scroll area to the main layout
-        main_layout.addWidget(scroll_area)
-        
-        # Buttons - now with Apply button
-        buttons = QDialogButtonBox(QDialogButtonBox.Apply | QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.button(QDialogButtonBox.Apply).clicked.connect(self.apply_settings)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        main_layout.addWidget(buttons)
-        
-        # Store reference to parent for applying settings
-        self.parent = parent
+        self.build_sections(layout, (('rate', "Rate Limiting", QFormLayout()),))
+    
+    def build_collection_tab(self, layout):
+        self.build_sections(layout, (
+            ('perf', "Performance Settings", QFormLayout()),
+            ('filter', "Data Filtering", QVBoxLayout()),
+            ('validation', "Data Validation", QVBoxLayout()),
+            ('web', "Web Scraping", QVBoxLayout()),
+        ))
+    
+    def build_sections(self, layout, sections):
+        """Add group boxes holding the SETTINGS_FIELDS widgets of the given sections."""
+        section_layouts = {}
+        for section, title, section_layout in sections:
+            group = QGroupBox(title)
+            group.setLayout(section_layout)
+            layout.addWidget(group)
+            section_layouts[section] = section_layout
+        
+        for key, attr, section, label, bounds, default in self.SETTINGS_FIELDS:
+            section_layout = section_layouts.get(section)
+            if section_layout is None:
+                continue
+            if bounds is None:
+                widget = QCheckBox(label)
+                section_layout.addWidget(widget)
+                self.bind(key, widget.isChecked, widget.setChecked)
+            else:
+                widget = QSpinBox()
+                widget.setRange(*bounds)
+                if isinstance(section_layout, QFormLayout):
+                    section_layout.addRow(label, widget)
+                else:
+                    section_layout.addWidget(QLabel(label))
+                    section_layout.addWidget(widget)
+                self.bind(key, widget.value, widget.setValue)
+            setattr(self, attr, widget)
+    
+    def done(self, result):
+        # Closing the dialog must not drop (or later replay) a pending Apply
+        if self.apply_timer.isActive():
+            self.apply_timer.stop()
+            self.do_apply_settings()
+        super().done(result)
     
     def browse_proxy_file(self):
         from PyQt5.QtWidgets import QFileDialog
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Proxy List File", "", "Text Files (*.txt);;All Files (*)"
-        )
-        if file_path:
-            self.proxy_file_input.setText(file_path)
+        """Browse for proxy file, reusing one dialog across clicks."""
+        if self.proxy_dialog is None:
+            self.proxy_dialog = QFileDialog(self, "Select Proxy List File")
+            self.proxy_dialog.setNameFilter("Text Files (*.txt);;All Files (*)")
+            self.proxy_dialog.setFileMode(QFileDialog.ExistingFile)
+        if self.proxy_dialog.exec_():
+            self.proxy_file_input.setText(self.proxy_dialog.selectedFiles()[0])
     
     def get_settings(self):
-        theme = "Light"
-        if self.dark_theme_radio.isChecked():
-            theme = "Dark"
-        elif self.blue_theme_radio.isChecked():
-            theme = "Blue"
-        elif self.green_theme_radio.isChecked():
-            theme = "Green"
-            
-        return {
-            'api_key': self.api_key_input.text(),
-            'use_proxy': self.use_proxy_checkbox.isChecked(),
-            'proxy_file': self.proxy_file_input.text(),
-            'use_tor': self.use_tor_checkbox.isChecked(),
-            'theme': theme,
-            'thread_count': self.thread_count.value(),
-            'batch_size': self.batch_size.value(),
-            'skip_missing_social': self.skip_missing_social_checkbox.isChecked(),
-            'requests_per_minute': self.requests_per_minute.value(),
-            'random_delay_min': self.random_delay_min.value(),
-            'random_delay_max': self.random_delay_max.value(),
-            'validate_phone': self.validate_phone_checkbox.isChecked(),
-            'validate_email': self.validate_email_checkbox.isChecked(),
-            'validate_website': self.validate_website_checkbox.isChecked(),
-            'enable_web_scraping': self.enable_web_scraping_checkbox.isChecked(),
-            'web_scraping_workers': self.web_scraping_workers.value()
-        }
+        # Tabs never opened keep the values they were given
+        settings = dict(self.values)
+        for key, (getter, _) in self.bindings.items():
+            settings[key] = getter()
+        return settings
     
     def set_theme(self, theme):
-        if theme == "Dark":
-            self.dark_theme_radio.setChecked(True)
-        elif theme == "Blue":
-            self.blue_theme_radio.setChecked(True)
-        elif theme == "Green":
-            self.green_theme_radio.setChecked(True)
-        else:
-            self.light_theme_radio.setChecked(True)
+        self.theme_combo.setCurrentIndex(max(self.theme_combo.findData(theme), 0))
     
     def set_settings(self, settings):
         """Set current settings values"""
-        self.api_key_input.setText(settings.get('api_key', ''))
-        self.use_proxy_checkbox.setChecked(settings.get('use_proxy', False))
-        self.proxy_file_input.setText(settings.get('proxy_file', ''))
-        self.use_tor_checkbox.setChecked(settings.get('use_tor', False))
-        self.set_theme(settings.get('theme', 'Light'))
-        self.thread_count.setValue(settings.get('thread_count', 4))
-        self.batch_size.setValue(settings.get('batch_size', 4))
-        self.skip_missing_social_checkbox.setChecked(settings.get('skip_missing_social', True))
-        self.requests_per_minute.setValue(settings.get('requests_per_minute', 20))
-        self.random_delay_min.setValue(settings.get('random_delay_min', 1))
-        self.random_delay_max.setValue(settings.get('random_delay_max', 2))
-        self.validate_phone_checkbox.setChecked(settings.get('validate_phone', True))
-        self.validate_email_checkbox.setChecked(settings.get('validate_email', True))
-        self.validate_website_checkbox.setChecked(settings.get('validate_website', True))
-        self.enable_web_scraping_checkbox.setChecked(settings.get('enable_web_scraping', True))
-        self.web_scraping_workers.setValue(settings.get('web_scraping_workers', 5))
+        for key in self.values:
+            if key in settings:
+                self.values[key] = settings[key]
+        for key, (_, setter) in self.bindings.items():
+            setter(self.values[key])
     
     def apply_settings(self):
-        """Apply settings without closing the dialog"""
+        """Apply settings without closing the dialog, once Apply clicks settle"""
+        self.apply_timer.start()
+    
+    def do_apply_settings(self):
         if self.parent:
             # Get the current settings
             new_settings = self.get_settings()
+            if new_settings == self.parent.settings:
+                return  # Nothing changed, so no re-theme, write or confirmation
             
-            # Apply theme immediately if changed
+            # Re-theme and confirm with painting held off, so the window repaints once
             current_theme = self.parent.settings.get('theme', 'Light')
             new_theme = new_settings.get('theme', 'Light')
-            if current_theme != new_theme:
-                self.parent.apply_theme(new_theme)
-            
-            # Update parent settings
-            self.parent.settings = new_settings
-            self.parent.save_settings()
+            self.parent.setUpdatesEnabled(False)
+            try:
+                if current_theme != new_theme:
+                    self.parent.apply_theme(new_theme)
+                
+                # Update parent settings
+                self.parent.settings = new_settings
+                
+                # Confirm inside the dialog rather than with a blocking message box
+                self.status_label.setText("Settings applied.")
+                self.status_timer.start()
+            finally:
+                self.parent.setUpdatesEnabled(True)
+                self.parent.update()
             
-            # Show confirmation message
-            from PyQt5.QtWidgets import QMessageBox
-            QMessageBox.information(self, "Settings Applied", "Settings have been applied successfully.")
\ No newline at end of file
+            # Write to disk only after the repaint has been queued
+            self.parent.save_settings()
\ No newline at end of file
@@ -10,6 +10,36 @@ from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 
+# User agents to rotate between; one is picked per driver and kept for its lifetime
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0)",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:124.0) Gecko/20100101 Firefox/124.0)"
+)
+
+# Locators for Maps search result entries, most specific first
+RESULT_SELECTORS = (
+    (By.CSS_SELECTOR, "div[role='article']"),
+    (By.CSS_SELECTOR, "div.section-result"),
+    (By.CSS_SELECTOR, "div.place-result"),
+    (By.CSS_SELECTOR, "div[jsaction*='mouseover']"),
+    (By.CSS_SELECTOR, "div[aria-label*='result']"),
+    (By.CSS_SELECTOR, "div.m6QErb.DxyBCb.kA9KIf.dS8AEf.ecceSd"),
+    (By.CSS_SELECTOR, "div[jscontroller='AtSb']"),
+    (By.CSS_SELECTOR, "div[aria-label*='Results for']")
+)
+
+# Locators for the control that loads more results
+LOAD_MORE_SELECTORS = (
+    (By.CSS_SELECTOR, "button[aria-label='More results']"),
+    (By.CSS_SELECTOR, "button[aria-label*='more']"),
+    (By.CSS_SELECTOR, "button[aria-label*='next']"),
+    (By.CSS_SELECTOR, "button[aria-label*='load']"),
+    (By.XPATH, "//button[contains(@aria-label, 'more') or contains(@aria-label, 'More')]")
+)
+
 class BrowserManager:
     """Manages browser instances and operations."""
     
@@ -51,14 +81,7 @@ class BrowserManager:
             chrome_options.add_argument(f"--user-agent={user_agent}")
         else:
             # Rotate user agent
-            user_agents = [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:124.0) Gecko/20100101 Firefox/124.0)",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:124.0) Gecko/20100101 Firefox/124.0)"
-            ]
-            chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
+            chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
         
         # Setup proxy if available
         if proxy:
@@ -118,18 +141,7 @@ class BrowserManager:
             return []
         
         # Try multiple selectors for search results
-        selectors = [
-            (By.CSS_SELECTOR, "div[role='article']"),
-            (By.CSS_SELECTOR, "div.section-result"),
-            (By.CSS_SELECTOR, "div.place-result"),
-            (By.CSS_SELECTOR, "div[jsaction*='mouseover']"),
-            (By.CSS_SELECTOR, "div[aria-label*='result']"),
-            (By.CSS_SELECTOR, "div.m6QErb.DxyBCb.kA9KIf.dS8AEf.ecceSd"),
-            (By.CSS_SELECTOR, "div[jscontroller='AtSb']"),
-            (By.CSS_SELECTOR, "div[aria-label*='Results for']")
-        ]
-        
-        for selector_by, selector_value in selectors:
+        for selector_by, selector_value in RESULT_SELECTORS:
             try:
                 results = self.driver.find_elements(selector_by, selector_value)
                 if results:
@@ -146,15 +158,7 @@ class BrowserManager:
         
         try:
             # Try multiple ways to load more results
-            load_more_selectors = [
-                (By.CSS_SELECTOR, "button[aria-label='More results']"),
-                (By.CSS_SELECTOR, "button[aria-label*='more']"),
-                (By.CSS_SELECTOR, "button[aria-label*='next']"),
-                (By.CSS_SELECTOR, "button[aria-label*='load']"),
-                (By.XPATH, "//button[contains(@aria-label, 'more') or contains(@aria-label, 'More')]")
-            ]
-            
-            for load_by, load_value in load_more_selectors:
+            for load_by, load_value in LOAD_MORE_SELECTORS:
                 try:
                     load_more_button = self.driver.find_element(load_by, load_value)
                     if load_more_button and load_more_button.is_displayed():
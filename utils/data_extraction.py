@@ -6,16 +6,179 @@ import json
 import uuid
 import time
 import random
+import threading
 import requests
 import phonenumbers
+import lxml.html
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional, Union
+from config import PLATFORM_FINGERPRINTS, SOCIAL_PATTERNS, WHATSAPP_LINK, PHONE_REGEX
+
+# Try to import selectolax, but make it optional; prefer its Lexbor backend
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        SELECTOLAX_AVAILABLE = True
+    except ImportError:
+        SELECTOLAX_AVAILABLE = False
+
+# lxml parsers are not thread-safe, so each thread keeps and reuses its own
+_LOCAL = threading.local()
+
+# Seconds allowed per page request while crawling a site for emails
+EMAIL_FETCH_TIMEOUT = 10
+
+# Regexes are compiled once here since the extractors run for every scraped page
+_RE_WHITESPACE = re.compile(r"\s+")
+_RE_EMAIL = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_RE_VALID_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# One alternation per platform, checked in PLATFORM_FINGERPRINTS order
+_RE_PLATFORMS = [(plat, re.compile("|".join(patterns), re.I)) for plat, patterns in PLATFORM_FINGERPRINTS.items()]
+_RE_SOCIALS = [(label, re.compile(pat, re.I)) for label, pat in SOCIAL_PATTERNS.items()]
+_RE_WHATSAPP = re.compile(WHATSAPP_LINK, re.I)
+_RE_WHATSAPP_WORD = re.compile('whatsapp', re.I)
+_RE_PHONE = re.compile(PHONE_REGEX, re.I)
+_RE_ADDRESSES = [
+    re.compile(r'\d+\s+[\w\s]+,\s*[\w\s]+,\s*[\w\s]+,\s*\d{5}'),
+    re.compile(r'\d+\s+[\w\s]+,\s*[\w\s]+,\s*\d{5}'),
+    re.compile(r'\d+\s+[\w\s]+,\s*[\w\s]+'),
+]
+_RE_TITLE_SUFFIX = re.compile(r'\s*[-|]\s*(Home|Welcome|Official Site|Page|Shop|Store)?$')
+_RE_TITLE_AFTER_PIPE = re.compile(r'\s*\|\s.*$')
+
+# CSS selectors shared by the page scanners
+LINK_SELECTOR = 'a[href]'
+INSTAGRAM_LINK_SELECTOR = 'a[href*="instagram.com"]'
+
+def page_text_and_links(html: str, selector: str = LINK_SELECTOR) -> Tuple[str, List[Tuple[str, str]]]:
+    """Return a page's visible text and the (href, text) pairs of links matching selector.
+    
+    Uses the C-backed selectolax parser when installed, falling back to
+    BeautifulSoup with lxml.
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        text = tree.root.text(separator=" ") if tree.root is not None else ""
+        links = [(node.attributes.get('href') or "", node.text()) for node in tree.css(selector)]
+        return text, links
+    
+    soup = BeautifulSoup(html, 'lxml')
+    links = [(tag.get('href') or "", tag.get_text()) for tag in soup.select(selector)]
+    return soup.get_text(), links
+
+def _lxml_parser():
+    parser = getattr(_LOCAL, 'parser', None)
+    if parser is None:
+        parser = _LOCAL.parser = lxml.html.HTMLParser(recover=True)
+    return parser
+
+def page_link_hrefs(html: str, selector: str = LINK_SELECTOR, xpath: Optional[str] = None) -> List[str]:
+    """Return the hrefs of links matching selector, without extracting the page text.
+    
+    Without selectolax, an equivalent xpath (if given) is run on lxml directly
+    with a reused per-thread parser instead of building a BeautifulSoup.
+    """
+    if SELECTOLAX_AVAILABLE:
+        return [node.attributes.get('href') or "" for node in HTMLParser(html).css(selector)]
+    
+    if xpath is not None:
+        try:
+            tree = lxml.html.fromstring(html, parser=_lxml_parser())
+        except (ValueError, lxml.etree.ParserError):
+            return []
+        return [tag.get('href') or "" for tag in tree.xpath(xpath)]
+    
+    soup = BeautifulSoup(html, 'lxml')
+    return [tag.get('href') or "" for tag in soup.select(selector)]
+
+def first_link_or_text_match(html: str, selector: str, regex):
+    """Return (href, match): the first link matching selector, else the first regex match in the text.
+    
+    The text is searched one node at a time and the walk stops at the first
+    hit, so the whole page text is never built.
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        link = tree.css_first(selector)
+        if link is not None:
+            return link.attributes.get('href') or "", None
+        if tree.root is not None:
+            for node in tree.root.traverse():
+                match = regex.search(node.text(deep=False))
+                if match:
+                    return None, match
+        return None, None
+    
+    soup = BeautifulSoup(html, 'lxml')
+    link = soup.select_one(selector)
+    if link is not None:
+        return link.get('href') or "", None
+    for string in soup.strings:
+        match = regex.search(string)
+        if match:
+            return None, match
+    return None, None
+
+class HtmlDocument:
+    """Read-only CSS queries over a page, backed by selectolax when installed, else BeautifulSoup."""
+    
+    def __init__(self, html: str = "", soup: Optional[BeautifulSoup] = None):
+        self._tree = None
+        self._soup = soup
+        if soup is None:
+            if SELECTOLAX_AVAILABLE:
+                self._tree = HTMLParser(html)
+            else:
+                self._soup = BeautifulSoup(html, 'lxml')
+    
+    def _first(self, selector: str):
+        if self._tree is not None:
+            return self._tree.css_first(selector)
+        return self._soup.select_one(selector)
+    
+    def text(self, selector: str, separator: str = "", strip: bool = False) -> Optional[str]:
+        """Text of the first element matching selector, or None if nothing matches."""
+        node = self._first(selector)
+        if node is None:
+            return None
+        if self._tree is not None:
+            return node.text(separator=separator, strip=strip)
+        return node.get_text(separator, strip=strip)
+    
+    def scope(self, selector: str) -> Optional["HtmlDocument"]:
+        """The first element matching selector as a document of its own, or None.
+        
+        Queries on the result only see that element's descendants.
+        """
+        node = self._first(selector)
+        if node is None:
+            return None
+        scoped = HtmlDocument.__new__(HtmlDocument)
+        scoped._tree, scoped._soup = (node, None) if self._tree is not None else (None, node)
+        return scoped
+    
+    def attr(self, selector: str, name: str) -> Optional[str]:
+        """Attribute of the first element matching selector, or None."""
+        node = self._first(selector)
+        if node is None:
+            return None
+        if self._tree is not None:
+            return node.attributes.get(name)
+        value = node.get(name)
+        return " ".join(value) if isinstance(value, list) else value
+
+def _as_document(page: Union[HtmlDocument, BeautifulSoup]) -> HtmlDocument:
+    # The guessers used to take a BeautifulSoup and still accept one
+    return page if isinstance(page, HtmlDocument) else HtmlDocument(soup=page)
 
 class EmailExtractor:
     """Extracts email addresses from websites."""
     
-    def __init__(self):
+    def __init__(self, session=None):
         self.email_patterns = [
             r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Standard email
             r'\b[A-Za-z0-9._%+-]+\s*@\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email with spaces around @
@@ -23,13 +186,17 @@ class EmailExtractor:
             r'\b[A-Za-z0-9._%+-]+\(at\)[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email with (at)
             r'\b[A-Za-z0-9._%+-]+\s*\(a\)\s*[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',  # Email with (a)
         ]
+        # All variants in one pass over the page text
+        self.email_regex = re.compile("|".join(f"(?:{p})" for p in self.email_patterns), re.IGNORECASE)
         self.contact_keywords = ['contact', 'about', 'team', 'staff', 'reach', 'connect']
+        if session is not None:
+            # Share the caller's connection pool and headers
+            self.session = session
+            return
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36'
         })
-        # Set timeout for requests
-        self.session.timeout = 10
     
     def extract_emails(self, url, max_pages=2):
         """Extract emails from a website and its contact pages."""
@@ -48,28 +215,24 @@ class EmailExtractor:
             visited_urls.add(current_url)
             
             try:
-                response = self.session.get(current_url)
+                response = self.session.get(current_url, timeout=EMAIL_FETCH_TIMEOUT)
                 if response.status_code != 200:
                     continue
                     
-                soup = BeautifulSoup(response.text, 'html.parser')
+                text, links = page_text_and_links(response.text)
                 
                 # Extract emails from text
-                text = soup.get_text()
-                for pattern in self.email_patterns:
-                    found_emails = re.findall(pattern, text, re.IGNORECASE)
-                    for email in found_emails:
-                        # Clean up the email
-                        clean_email = email.replace(' ', '').replace('[', '').replace(']', '').replace('(at)', '@').replace('(a)', '@')
-                        if self.validate_email(clean_email):
-                            emails.add(clean_email.lower())
+                for email in self.email_regex.findall(text):
+                    # Clean up the email
+                    clean_email = email.replace(' ', '').replace('[', '').replace(']', '').replace('(at)', '@').replace('(a)', '@')
+                    if self.validate_email(clean_email):
+                        emails.add(clean_email.lower())
                 
                 # Find links to contact pages
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href')
+                for href, link_text in links:
                     if href and not href.startswith('mailto:') and not href.startswith('tel:'):
                         absolute_url = urljoin(current_url, href)
-                        if self.is_contact_page(link.text.lower()) and absolute_url not in visited_urls:
+                        if self.is_contact_page(link_text.lower()) and absolute_url not in visited_urls:
                             urls_to_visit.append(absolute_url)
                             
             except Exception as e:
@@ -80,8 +243,7 @@ class EmailExtractor:
     
     def validate_email(self, email):
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _RE_VALID_EMAIL.match(email) is not None
     
     def is_contact_page(self, text):
         """Check if a link text suggests it's a contact page."""
@@ -93,37 +255,33 @@ class DataExtractor:
     @staticmethod
     def clean_text(s: str) -> str:
         """Clean text by normalizing whitespace."""
-        return re.sub(r"\s+", " ", s or "").strip()
+        return _RE_WHITESPACE.sub(" ", s or "").strip()
     
     @staticmethod
     def detect_platform(html: str) -> str:
         """Detect e-commerce platform from HTML content."""
-        from config import PLATFORM_FINGERPRINTS
-        
-        for plat, patterns in PLATFORM_FINGERPRINTS.items():
-            for pat in patterns:
-                if re.search(pat, html, flags=re.I):
-                    return plat
+        for plat, regex in _RE_PLATFORMS:
+            if regex.search(html):
+                return plat
         return ""
     
     @staticmethod
-    def extract_meta(soup: BeautifulSoup, *names) -> str:
+    def extract_meta(page: Union[HtmlDocument, BeautifulSoup], *names) -> str:
         """Extract content from meta tags by name or property."""
+        doc = _as_document(page)
         for n in names:
-            tag = soup.find("meta", attrs={"name": n}) or soup.find("meta", attrs={"property": n})
-            if tag and tag.get("content"):
-                return DataExtractor.clean_text(tag["content"])
+            content = doc.attr(f'meta[name="{n}"]', "content") or doc.attr(f'meta[property="{n}"]', "content")
+            if content:
+                return DataExtractor.clean_text(content)
         return ""
     
     @staticmethod
     def extract_socials(html: str) -> Tuple[str, Dict[str, str]]:
         """Extract social media links from HTML."""
-        from config import SOCIAL_PATTERNS
-        
         socials = {}
         insta = ""
-        for label, pat in SOCIAL_PATTERNS.items():
-            m = re.search(pat, html, flags=re.I)
+        for label, regex in _RE_SOCIALS:
+            m = regex.search(html)
             if m:
                 url = m.group(1)
                 if label == "Instagram" and not insta:
@@ -134,15 +292,13 @@ class DataExtractor:
     @staticmethod
     def extract_whatsapp(html: str) -> str:
         """Extract WhatsApp link from HTML."""
-        from config import WHATSAPP_LINK, PHONE_REGEX
-        
-        m = re.search(WHATSAPP_LINK, html, flags=re.I)
+        m = _RE_WHATSAPP.search(html)
         if m:
             return m.group(1)
         
         # fallback: if "whatsapp" appears near a phone-like pattern
-        if "whatsapp" in html.lower():
-            m2 = re.search(PHONE_REGEX, html, flags=re.I)
+        if _RE_WHATSAPP_WORD.search(html):
+            m2 = _RE_PHONE.search(html)
             if m2:
                 return m2.group(0)
         return "N/A"
@@ -150,8 +306,9 @@ class DataExtractor:
     @staticmethod
     def extract_emails(html: str) -> List[str]:
         """Extract email addresses from HTML."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, html)
+        if '@' not in html:
+            return []  # Substring scan is far cheaper than running the regex over the page
+        emails = _RE_EMAIL.findall(html)
         
         # Filter out common non-business emails
         filtered_emails = []
@@ -161,32 +318,42 @@ class DataExtractor:
         return filtered_emails
     
     @staticmethod
-    def extract_address(html: str) -> str:
-        """Extract address information from HTML."""
+    def extract_all(html: str, doc: HtmlDocument) -> Dict[str, Any]:
+        """Run every site-level extractor over one page, sharing a single parsed document."""
+        insta, socials = DataExtractor.extract_socials(html)
+        return {
+            'name': DataExtractor.guess_name(doc),
+            'niche': DataExtractor.guess_niche(doc),
+            'instagram': insta,
+            'socials': socials,
+            'whatsapp': DataExtractor.extract_whatsapp(html),
+            'address': DataExtractor.extract_address(html, doc),
+        }
+    
+    @staticmethod
+    def extract_address(html: str, doc: Optional[HtmlDocument] = None) -> str:
+        """Extract address information from HTML, reusing doc if the page is already parsed."""
         # Look for common address patterns
-        address_patterns = [
-            r'\d+\s+[\w\s]+,\s*[\w\s]+,\s*[\w\s]+,\s*\d{5}',
-            r'\d+\s+[\w\s]+,\s*[\w\s]+,\s*\d{5}',
-            r'\d+\s+[\w\s]+,\s*[\w\s]+'
-        ]
-        
-        for pattern in address_patterns:
-            match = re.search(pattern, html)
+        for regex in _RE_ADDRESSES:
+            match = regex.search(html)
             if match:
                 return DataExtractor.clean_text(match.group(0))
         
         # Check for address in structured data
-        soup = BeautifulSoup(html, 'lxml')
+        if doc is None:
+            doc = HtmlDocument(html)
         for itemtype in ['PostalAddress', 'LocalBusiness']:
-            address_tag = soup.find(attrs={'itemtype': f'http://schema.org/{itemtype}'})
-            if address_tag:
-                address_parts = []
-                for part in ['streetAddress', 'addressLocality', 'addressRegion', 'postalCode']:
-                    tag = address_tag.find(attrs={'itemprop': part})
-                    if tag:
-                        address_parts.append(tag.get_text())
-                if address_parts:
-                    return ', '.join(address_parts)
+            # All parts come from the first block of this type, not from several blocks
+            scope = doc.scope(f'[itemtype="http://schema.org/{itemtype}"]')
+            if scope is None:
+                continue
+            address_parts = []
+            for part in ['streetAddress', 'addressLocality', 'addressRegion', 'postalCode']:
+                text = scope.text(f'[itemprop="{part}"]')
+                if text is not None:
+                    address_parts.append(text)
+            if address_parts:
+                return ', '.join(address_parts)
         
         return ""
     
@@ -207,53 +374,54 @@ class DataExtractor:
         return not any(term in name_lower for term in generic_terms)
     
     @staticmethod
-    def guess_name(soup: BeautifulSoup) -> str:
+    def guess_name(page: Union[HtmlDocument, BeautifulSoup]) -> str:
         """Guess business name from HTML."""
+        doc = _as_document(page)
+        
         # Try business name from structured data first
         business_name = ""
         
         # Check for organization name in structured data
-        org_tag = soup.find(attrs={'itemtype': 'http://schema.org/Organization'})
-        if org_tag:
-            name_tag = org_tag.find(attrs={'itemprop': 'name'})
-            if name_tag:
-                business_name = DataExtractor.clean_text(name_tag.get_text())
-                if DataExtractor.is_business_name(business_name):
-                    return business_name
+        org = doc.scope('[itemtype="http://schema.org/Organization"]')
+        name_text = org.text('[itemprop="name"]') if org is not None else None
+        if name_text is not None:
+            business_name = DataExtractor.clean_text(name_text)
+            if DataExtractor.is_business_name(business_name):
+                return business_name
         
         # Try logo alt text which often contains business name
-        logo = soup.find('img', {'id': 'logo'}) or soup.find('img', {'class': 'logo'})
-        if logo and logo.get('alt'):
-            business_name = DataExtractor.clean_text(logo['alt'])
+        logo_alt = doc.attr('img#logo', 'alt') or doc.attr('img.logo', 'alt')
+        if logo_alt:
+            business_name = DataExtractor.clean_text(logo_alt)
             if DataExtractor.is_business_name(business_name):
                 return business_name
         
         # Try site title but clean it
-        title = soup.title.text if soup.title else ""
+        title = doc.text('title') or ""
         if title:
             # Remove common suffixes
-            clean_title = re.sub(r'\s*[-|]\s*(Home|Welcome|Official Site|Page|Shop|Store)?$', '', title)
-            clean_title = re.sub(r'\s*\|\s.*$', '', clean_title)  # Remove anything after |
+            clean_title = _RE_TITLE_SUFFIX.sub('', title)
+            clean_title = _RE_TITLE_AFTER_PIPE.sub('', clean_title)  # Remove anything after |
             if DataExtractor.is_business_name(clean_title):
                 return clean_title
         
         # Try h1 tag
-        h1 = soup.find("h1")
-        if h1:
-            h1_text = DataExtractor.clean_text(h1.get_text())
+        h1 = doc.text('h1')
+        if h1 is not None:
+            h1_text = DataExtractor.clean_text(h1)
             if DataExtractor.is_business_name(h1_text):
                 return h1_text
         
         # Try site name from meta tags
-        site_name = DataExtractor.extract_meta(soup, "og:site_name", "application-name", "twitter:title")
+        site_name = DataExtractor.extract_meta(doc, "og:site_name", "application-name", "twitter:title")
         if site_name and DataExtractor.is_business_name(site_name):
             return site_name
         
         # If all else fails, use domain name
-        url_tag = soup.find('link', {'rel': 'canonical'})
-        if url_tag and url_tag.get('href'):
+        canonical = doc.attr('link[rel~="canonical"]', 'href')
+        if canonical:
             try:
-                parsed = urlparse(url_tag['href'])
+                parsed = urlparse(canonical)
                 domain = parsed.netloc
                 if domain.startswith('www.'):
                     domain = domain[4:]
@@ -267,14 +435,15 @@ class DataExtractor:
         return ""
     
     @staticmethod
-    def guess_niche(soup: BeautifulSoup) -> str:
+    def guess_niche(page: Union[HtmlDocument, BeautifulSoup]) -> str:
         """Guess business niche from HTML."""
-        desc = DataExtractor.extract_meta(soup, "description", "og:description")
+        doc = _as_document(page)
+        desc = DataExtractor.extract_meta(doc, "description", "og:description")
         if desc:
             return desc
         # try common labels
         for sel in ["[itemprop=description]", ".product-description", ".about", ".site-description"]:
-            el = soup.select_one(sel)
-            if el:
-                return DataExtractor.clean_text(el.get_text(" ", strip=True))
+            text = doc.text(sel, separator=" ", strip=True)
+            if text is not None:
+                return DataExtractor.clean_text(text)
         return ""
\ No newline at end of file
@@ -1,11 +1,48 @@
 """File operation utilities."""
 
 import os
-import json
 import shutil
-import pandas as pd
 import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
+
+from utils import json_io
+
+class _SafeFilenameTable(dict):
+    """str.translate table deleting whatever [^\w\s-] would; filled in per code point on first use."""
+    
+    def __missing__(self, code):
+        char = chr(code)
+        self[code] = code if char.isalnum() or char.isspace() or char in '_-' else None
+        return self[code]
+
+_SAFE_FILENAME = _SafeFilenameTable()
+
+# Try to import ijson, but make it optional
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+class JsonLinesWriter:
+    """Appends records to a JSON Lines file as they arrive."""
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.file = open(file_path, 'ab')
+    
+    def write_line(self, record: Dict[str, Any]):
+        """Write one record as a single line."""
+        self.file.write(json_io.dumps(record) + b"\n")
+    
+    def close(self):
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
 class FileManager:
     """Manages file operations for the application."""
@@ -22,6 +59,8 @@ class FileManager:
     def export_to_csv(data: List[Dict[str, Any]], file_path: str) -> bool:
         """Export data to a CSV file."""
         try:
+            # Imported here; the collector thread uses FileManager without ever exporting CSV
+            import pandas as pd
             df = pd.DataFrame(data)
             df.to_csv(file_path, index=False)
             return True
@@ -33,23 +72,39 @@ class FileManager:
     def export_to_json(data: List[Dict[str, Any]], file_path: str) -> bool:
         """Export data to a JSON file."""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(json_io.dumps(data, indent=True))
             return True
         except Exception as e:
             print(f"Error exporting to JSON: {e}")
             return False
     
+    @staticmethod
+    def open_stream(file_path: str) -> JsonLinesWriter:
+        """Open a JSON Lines file for writing records one at a time."""
+        return JsonLinesWriter(file_path)
+    
+    @staticmethod
+    def read_stream(file_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield records from a JSON Lines file, or from a JSON array file without loading it whole."""
+        with open(file_path, 'rb') as f:
+            if file_path.endswith('.jsonl'):
+                for line in f:
+                    if line.strip():
+                        yield json_io.loads(line)
+            elif IJSON_AVAILABLE:
+                yield from ijson.items(f, 'item')
+            else:
+                yield from json_io.loads(f.read())
+    
     @staticmethod
     def copy_image(source_path: str, dest_dir: str, name: str) -> str:
         """Copy an image to the destination directory with a safe filename."""
-        import re
-        
         if not os.path.exists(source_path):
             return ""
         
         # Create a safe filename from the business name
-        safe_name = re.sub(r'[^\w\s-]', '', name).strip().replace(' ', '_')
+        safe_name = name.translate(_SAFE_FILENAME).strip().replace(' ', '_')
         if not safe_name:
             safe_name = "image"
         
@@ -2,12 +2,16 @@
 
 import socket
 import time
+import asyncio
 import requests
 import random
 import os
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QTimer, QUrl, pyqtSignal
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Try to import stem, but make it optional
 try:
@@ -17,42 +21,103 @@ try:
 except ImportError:
     TOR_AVAILABLE = False
 
-class InternetConnectionChecker(QThread):
-    """Checks internet connection status in a background thread."""
+def create_pooled_session(pool_connections=20, pool_maxsize=50, retries=2):
+    """Create a requests session with a larger keep-alive pool and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=retries, backoff_factor=0.2)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` requests per second with bursts up to `capacity`.
+    
+    Use `with bucket:` on threads or `async with bucket:` on an event loop; each
+    caller only waits for its own slot instead of sleeping a fixed delay.
+    """
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self):
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    def __enter__(self):
+        time.sleep(self.reserve())
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+    
+    async def __aenter__(self):
+        await asyncio.sleep(self.reserve())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+class InternetConnectionChecker(QObject):
+    """Checks internet connection status with periodic asynchronous HEAD requests.
+    
+    Runs on the Qt event loop of the thread that owns it, so no worker thread
+    sleeps between checks.
+    """
     
     connection_status_changed = pyqtSignal(bool)  # True if connected, False if disconnected
     
-    def __init__(self):
-        super().__init__()
-        self.is_running = True
+    CHECK_URL = "https://www.google.com/generate_204"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.check_interval = 5  # Check every 5 seconds
         self.timeout = 3  # Timeout for each check
+        self.manager = QNetworkAccessManager(self)
+        self.reply = None  # The in-flight check, if any
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.check_interval * 1000)
+        self.timer.timeout.connect(self.check_internet_connection)
         
-    def run(self):
-        while self.is_running:
-            is_connected = self.check_internet_connection()
-            self.connection_status_changed.emit(is_connected)
-            time.sleep(self.check_interval)
+    def start(self):
+        self.check_internet_connection()
+        self.timer.start()
     
     def check_internet_connection(self):
-        try:
-            # Try to connect to Google's DNS
-            socket.create_connection(("8.8.8.8", 53), timeout=self.timeout)
-            return True
-        except OSError:
-            pass
+        if self.reply is not None:
+            return  # Previous check still running
         
-        try:
-            # Try to connect to Google's website
-            response = requests.get("https://www.google.com", timeout=self.timeout)
-            return response.status_code == 200
-        except:
-            pass
-        
-        return False
+        reply = self.manager.head(QNetworkRequest(QUrl(self.CHECK_URL)))
+        reply.finished.connect(lambda: self._on_check_finished(reply))
+        QTimer.singleShot(self.timeout * 1000, lambda: self._abort_if_pending(reply))
+        self.reply = reply
+    
+    def _abort_if_pending(self, reply):
+        if self.reply is reply:
+            reply.abort()
+    
+    def _on_check_finished(self, reply):
+        self.reply = None
+        is_connected = reply.error() == QNetworkReply.NoError
+        reply.deleteLater()
+        self.connection_status_changed.emit(is_connected)
     
     def stop(self):
-        self.is_running = False
+        self.timer.stop()
+        if self.reply is not None:
+            self.reply.abort()
 
 class ProxyManager:
     """Manages proxy rotation and Tor functionality."""